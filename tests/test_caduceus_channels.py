@@ -204,7 +204,8 @@ class TestTelegramChannel:
         config = {"machines": {"lab": {"host": "localhost", "repo_path": "/tmp/test"}}}
         machines = TelegramChannel._load_machines(config)
         assert "lab" in machines
-        assert machines["lab"]["host"] == "localhost"
+        assert machines["lab"].host == "localhost"
+        assert machines["lab"].is_local is True
 
     def test_load_machines_legacy_format(self):
         TelegramChannel = importlib.import_module(
@@ -28,7 +28,7 @@ class DummyArticle:
         self.summary = "Article summary"
         self.keywords = ["python", "visualization"]
 
-    def download(self):
+    def set_html(self, html):
         return None
 
     def parse(self):
@@ -43,7 +43,7 @@ class DummyArticle:
 @patch("caduceus.feed_processor.Article", DummyArticle)
 @patch("caduceus.feed_processor.trafilatura.extract")
 @patch("caduceus.feed_processor.trafilatura.extract_metadata")
-@patch("caduceus.feed_processor.trafilatura.fetch_url")
+@patch("caduceus.feed_processor._fetch_html", new_callable=AsyncMock)
 async def test_process_feed_dispatches_github_enrichment(
     mock_fetch,
     mock_metadata,
@@ -85,7 +85,7 @@ async def test_process_feed_dispatches_github_enrichment(
 @patch("caduceus.feed_processor.Article", DummyArticle)
 @patch("caduceus.feed_processor.trafilatura.extract")
 @patch("caduceus.feed_processor.trafilatura.extract_metadata")
-@patch("caduceus.feed_processor.trafilatura.fetch_url")
+@patch("caduceus.feed_processor._fetch_html", new_callable=AsyncMock)
 async def test_process_feed_skips_enrichment_when_disabled(
     mock_fetch,
     mock_metadata,
@@ -148,7 +148,7 @@ async def test_spawn_enrichment_reports_missing_binary(_mock_resolve, tmp_path):
 @patch("caduceus.feed_processor.Article", DummyArticle)
 @patch("caduceus.feed_processor.trafilatura.extract")
 @patch("caduceus.feed_processor.trafilatura.extract_metadata")
-@patch("caduceus.feed_processor.trafilatura.fetch_url")
+@patch("caduceus.feed_processor._fetch_html", new_callable=AsyncMock)
 async def test_process_feed_marks_unavailable_when_enrichment_not_started(
     mock_fetch,
     mock_metadata,
@@ -181,7 +181,7 @@ async def test_process_feed_marks_unavailable_when_enrichment_not_started(
 @patch("caduceus.feed_processor.Article", DummyArticle)
 @patch("caduceus.feed_processor.trafilatura.extract")
 @patch("caduceus.feed_processor.trafilatura.extract_metadata")
-@patch("caduceus.feed_processor.trafilatura.fetch_url")
+@patch("caduceus.feed_processor._fetch_html", new_callable=AsyncMock)
 async def test_process_feed_updates_existing_duplicate_reference(
     mock_fetch,
     mock_metadata,
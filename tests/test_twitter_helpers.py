@@ -3,7 +3,7 @@ import importlib
 import sys
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -19,9 +19,9 @@ _fetch_twitter_content = fp._fetch_twitter_content
 process_feed = fp.process_feed
 
 
-def _urlopen_mock(body: bytes) -> MagicMock:
+def _http_get_mock(payload: dict) -> MagicMock:
     m = MagicMock()
-    m.read.return_value = body
+    m.json.return_value = payload
     return m
 
 
@@ -128,37 +128,35 @@ def test_parse_empty_blocks_insights_fall_back_to_summary():
 
 def test_resolve_tweet_username_success():
     html = '<a href="https://twitter.com/testuser/status/123">link</a>'
-    body = json.dumps({"html": html}).encode()
-    with patch("urllib.request.urlopen", return_value=_urlopen_mock(body)):
+    with patch.object(fp._HTTP, "get", return_value=_http_get_mock({"html": html})):
         assert _resolve_tweet_username("123") == "testuser"
 
 
 def test_resolve_tweet_username_no_match_returns_none():
-    body = json.dumps({"html": "<blockquote>no username here</blockquote>"}).encode()
-    with patch("urllib.request.urlopen", return_value=_urlopen_mock(body)):
+    payload = {"html": "<blockquote>no username here</blockquote>"}
+    with patch.object(fp._HTTP, "get", return_value=_http_get_mock(payload)):
         assert _resolve_tweet_username("123") is None
 
 
 def test_resolve_tweet_username_network_error_returns_none():
-    with patch("urllib.request.urlopen", side_effect=OSError("timeout")):
+    with patch.object(fp._HTTP, "get", side_effect=OSError("timeout")):
         assert _resolve_tweet_username("123") is None
 
 
 def test_fxtwitter_api_success():
     tweet_data = {"id": "123", "text": "Hello"}
-    body = json.dumps({"tweet": tweet_data}).encode()
-    with patch("urllib.request.urlopen", return_value=_urlopen_mock(body)):
+    with patch.object(fp._HTTP, "get", return_value=_http_get_mock({"tweet": tweet_data})):
         assert _fxtwitter_api("foo", "123") == tweet_data
 
 
 def test_fxtwitter_api_missing_tweet_key_returns_none():
-    body = json.dumps({"code": 404, "message": "Not Found"}).encode()
-    with patch("urllib.request.urlopen", return_value=_urlopen_mock(body)):
+    payload = {"code": 404, "message": "Not Found"}
+    with patch.object(fp._HTTP, "get", return_value=_http_get_mock(payload)):
         assert _fxtwitter_api("foo", "123") is None
 
 
 def test_fxtwitter_api_network_error_returns_none():
-    with patch("urllib.request.urlopen", side_effect=OSError("connection refused")):
+    with patch.object(fp._HTTP, "get", side_effect=OSError("connection refused")):
         assert _fxtwitter_api("foo", "123") is None
 
 
@@ -225,7 +223,7 @@ async def test_process_feed_twitter_api_success(mock_twitter, tmp_path):
 
 @pytest.mark.asyncio
 @patch("caduceus.feed_processor._fetch_twitter_content", return_value=None)
-@patch("caduceus.feed_processor.trafilatura.fetch_url", return_value=None)
+@patch("caduceus.feed_processor._fetch_html", new_callable=AsyncMock, return_value=None)
 async def test_process_feed_twitter_all_fetches_fail(mock_fetch, mock_twitter, tmp_path):
     refs_dir = tmp_path / ".sisyphus" / "references"
     refs_dir.mkdir(parents=True, exist_ok=True)
@@ -249,7 +247,7 @@ async def test_process_feed_twitter_all_fetches_fail(mock_fetch, mock_twitter, t
     return_value=SimpleNamespace(title="JavaScript is not available."),
 )
 @patch("caduceus.feed_processor.trafilatura.extract", return_value="We've detected JS is disabled")
-@patch("caduceus.feed_processor.trafilatura.fetch_url", return_value="<html>jsgated</html>")
+@patch("caduceus.feed_processor._fetch_html", new_callable=AsyncMock, return_value="<html>jsgated</html>")
 async def test_process_feed_twitter_js_gate_returns_error(mock_fetch, mock_extract, mock_meta, mock_twitter, tmp_path):
     refs_dir = tmp_path / ".sisyphus" / "references"
     refs_dir.mkdir(parents=True, exist_ok=True)
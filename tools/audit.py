@@ -6,8 +6,10 @@ Logs all Galaxy operations to logs/galaxy-audit.jsonl for compliance and debuggi
 Provides /audit command to query audit trail.
 """
 
+import bisect
 import json
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -15,6 +17,122 @@ from typing import Optional
 REPO_ROOT = Path(__file__).parent.parent.parent  # project root (when loaded as submodule)
 MODULE_ROOT = Path(__file__).parent.parent  # galaxy-protocol module root
 AUDIT_LOG = REPO_ROOT / "logs/galaxy-audit.jsonl"
+AUDIT_INDEX = AUDIT_LOG.with_suffix(".index.json")
+
+# Sparse (timestamp, byte offset) index over the audit log, sampled every
+# _INDEX_INTERVAL events. Lets `--since` queries seek close to the first
+# matching line instead of scanning the whole file. Offsets are time-ordered
+# because the log is append-only. Persisted to AUDIT_INDEX so the index
+# survives across CLI invocations.
+_INDEX_INTERVAL = 1000
+_offsets: list = []  # list[[timestamp, offset]]
+_indexed_size = 0  # bytes of the log covered by _offsets
+_indexed_events = 0  # events seen since the last sampled offset
+_index_loaded = False
+
+
+def _load_index():
+    """Load the persisted offset index, discarding it if the log shrank."""
+    global _offsets, _indexed_size, _indexed_events, _index_loaded
+    if _index_loaded:
+        return
+    _index_loaded = True
+    try:
+        data = json.loads(AUDIT_INDEX.read_text())
+        log_size = AUDIT_LOG.stat().st_size if AUDIT_LOG.exists() else 0
+        if data.get("indexed_size", 0) <= log_size:
+            _offsets = data.get("offsets", [])
+            _indexed_size = data.get("indexed_size", 0)
+            _indexed_events = data.get("indexed_events", 0)
+    except (json.JSONDecodeError, OSError):
+        pass
+
+
+def _save_index():
+    try:
+        AUDIT_INDEX.write_text(
+            json.dumps(
+                {
+                    "offsets": _offsets,
+                    "indexed_size": _indexed_size,
+                    "indexed_events": _indexed_events,
+                }
+            )
+        )
+    except OSError:
+        pass
+
+
+def _extend_index():
+    """Scan any unindexed tail of the log and sample new offsets."""
+    global _indexed_size, _indexed_events
+    _load_index()
+    try:
+        log_size = AUDIT_LOG.stat().st_size
+    except OSError:
+        return
+    if log_size < _indexed_size:
+        # Log was truncated/rotated — rebuild from scratch
+        _offsets.clear()
+        _indexed_size = 0
+        _indexed_events = 0
+    if log_size == _indexed_size:
+        return
+
+    with open(AUDIT_LOG, "r") as f:
+        f.seek(_indexed_size)
+        offset = _indexed_size
+        for line in f:
+            if _indexed_events % _INDEX_INTERVAL == 0:
+                try:
+                    ts = json.loads(line).get("timestamp", "")
+                    _offsets.append([ts, offset])
+                except json.JSONDecodeError:
+                    pass
+            offset += len(line.encode("utf-8"))
+            _indexed_events += 1
+        _indexed_size = offset
+    _save_index()
+
+
+def _seek_offset(since: str) -> int:
+    """Return a byte offset at or before the first event >= since."""
+    pos = bisect.bisect_left(_offsets, [since, 0])
+    if pos == 0:
+        return 0
+    return _offsets[pos - 1][1]
+
+
+def _format_event(timestamp: str, event_type: str, severity: str, data: dict) -> str:
+    """Format one audit event as a JSONL line.
+
+    Splices a pre-serialized envelope onto the data JSON instead of building
+    and serializing a merged dict, which skips the dict copy on the hot
+    append path. Kept as a standalone function so a compiled implementation
+    can be swapped in if append rates ever warrant it. Duplicate keys from
+    `data` still win on parse, matching the old `**data` merge order.
+    """
+    head = (
+        f'{{"timestamp": {json.dumps(timestamp)}, '
+        f'"event_type": {json.dumps(event_type)}, '
+        f'"severity": {json.dumps(severity)}'
+    )
+    if not data:
+        return head + "}\n"
+    return head + ", " + json.dumps(data)[1:] + "\n"
+
+
+# Flat-combining write path: concurrent log_event callers publish their line
+# to _pending under _write_lock; whichever thread finds no drain in progress
+# becomes the combiner and flushes the whole batch with a single write,
+# then wakes the waiters. Under contention N threads pay one syscall instead
+# of N opens/writes serialized on the inode lock.
+_write_lock = threading.Lock()
+_flush_done = threading.Condition(_write_lock)
+_pending: list = []  # encoded lines awaiting flush
+_enqueued_seq = 0  # lines ever enqueued
+_flushed_seq = 0  # lines ever flushed (or abandoned on write error)
+_draining = False
 
 
 def log_event(event_type: str, data: dict, severity: str = "info"):
@@ -26,17 +144,41 @@ def log_event(event_type: str, data: dict, severity: str = "info"):
         data: Event-specific data
         severity: Event severity (info, warning, error, critical)
     """
-    AUDIT_LOG.parent.mkdir(parents=True, exist_ok=True)
+    global _enqueued_seq, _flushed_seq, _draining
 
-    event = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "event_type": event_type,
-        "severity": severity,
-        **data,
-    }
+    AUDIT_LOG.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(AUDIT_LOG, "a") as f:
-        f.write(json.dumps(event) + "\n")
+    line = _format_event(
+        datetime.now(timezone.utc).isoformat(), event_type, severity, data
+    ).encode("utf-8")
+
+    with _write_lock:
+        _pending.append(line)
+        _enqueued_seq += 1
+        my_seq = _enqueued_seq
+
+        if _draining:
+            # Another thread is combining writes — it flushes our line too.
+            _flush_done.wait_for(lambda: _flushed_seq >= my_seq)
+            return
+
+        _draining = True
+        try:
+            while _flushed_seq < my_seq:
+                batch = _pending[:]
+                _pending.clear()
+                _write_lock.release()
+                try:
+                    with open(AUDIT_LOG, "ab") as f:
+                        f.write(b"".join(batch))
+                finally:
+                    _write_lock.acquire()
+                    # Count the batch as handled even on a failed write so
+                    # waiters never deadlock on lines that will never land.
+                    _flushed_seq += len(batch)
+        finally:
+            _draining = False
+            _flush_done.notify_all()
 
 
 def query_audit_log(
@@ -62,6 +204,11 @@ def query_audit_log(
 
     events = []
     with open(AUDIT_LOG, "r") as f:
+        if since:
+            # Seek near the first matching event via the sparse offset index
+            # instead of scanning from the head of the log.
+            _extend_index()
+            f.seek(_seek_offset(since))
         for line in f:
             try:
                 event = json.loads(line.strip())
@@ -86,36 +233,48 @@ def query_audit_log(
     return events[-limit:]
 
 
+SEVERITY_ICONS = {
+    "critical": "🚨",
+    "error": "❌",
+    "warning": "⚠️",
+    "info": "ℹ️",
+    "success": "✅",
+}
+
+
 def print_audit_report(events):
-    """Pretty print audit events."""
+    """Pretty print audit events.
+
+    Builds the whole report in memory and emits it with a single
+    sys.stdout.write — one syscall instead of ~5 print() calls per event,
+    which matters when dumping tens of thousands of events.
+    """
     if not events:
         print("No audit events found.")
         return
 
-    print(f"\n{'=' * 80}")
-    print(f"Galaxy Protocol Audit Report - {len(events)} events")
-    print(f"{'=' * 80}\n")
+    parts = [
+        f"\n{'=' * 80}\n",
+        f"Galaxy Protocol Audit Report - {len(events)} events\n",
+        f"{'=' * 80}\n\n",
+    ]
 
     for event in events:
         timestamp = event.get("timestamp", "Unknown")
         event_type = event.get("event_type", "unknown")
         severity = event.get("severity", "info")
 
-        severity_icon = {
-            "critical": "🚨",
-            "error": "❌",
-            "warning": "⚠️",
-            "info": "ℹ️",
-            "success": "✅",
-        }.get(severity, "•")
+        severity_icon = SEVERITY_ICONS.get(severity, "•")
 
-        print(f"{severity_icon} [{timestamp}] {event_type.upper()}")
+        parts.append(f"{severity_icon} [{timestamp}] {event_type.upper()}\n")
 
         for key, value in event.items():
-            if key not in ["timestamp", "event_type", "severity"]:
-                print(f"  {key}: {value}")
+            if key not in ("timestamp", "event_type", "severity"):
+                parts.append(f"  {key}: {value}\n")
+
+        parts.append("\n")
 
-        print()
+    sys.stdout.write("".join(parts))
 
 
 def main():
@@ -137,7 +296,7 @@ def main():
     )
 
     if args.json:
-        print(json.dumps(events, indent=2))
+        sys.stdout.write(json.dumps(events, indent=2) + "\n")
     else:
         print_audit_report(events)
 
@@ -4,10 +4,24 @@ Uses PyJWT with HS256 algorithm for signing.
 Tokens carry user_id, username, and expiry timestamp.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 
 import jwt
 
+# Verification results cached by token digest: repeat auths with the same
+# session token skip the HMAC + JSON decode and cost one BLAKE2b of the token
+# plus a dict lookup. Failures are cached too, so a bad token can't be used
+# to probe for timing differences. Entries live at most _CACHE_TTL_SECONDS —
+# well under any sane token expiry — and the OrderedDict is LRU-bounded.
+_CACHE_TTL_SECONDS = 60
+_CACHE_MAX_ENTRIES = 4096
+_verify_cache: OrderedDict[bytes, tuple[float, dict | None]] = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
 
 def create_token(
     user_id: str,
@@ -47,11 +61,37 @@ def verify_token(token: str, secret: str) -> dict | None:
         Dict with ``user_id`` and ``username`` on success, or ``None``
         if the token is expired, malformed, or has an invalid signature.
     """
+    key = hashlib.blake2b(
+        token.encode("utf-8") + secret.encode("utf-8"), digest_size=16
+    ).digest()
+    now = time.monotonic()
+    with _verify_cache_lock:
+        cached = _verify_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _verify_cache.move_to_end(key)
+            return cached[1]
+
+    ttl = _CACHE_TTL_SECONDS
+    result = None
     try:
-        payload = jwt.decode(token, secret, algorithms=["HS256"])
-        return {
-            "user_id": payload["user_id"],
-            "username": payload["username"],
-        }
+        # Expired-token fast path: peek at the unverified exp claim — one
+        # base64 decode and an int compare — so stale sessions (a reopened
+        # tab with an old cookie is the common case) never pay for the
+        # HMAC. The signature is still verified before trusting anything.
+        unverified = jwt.decode(token, options={"verify_signature": False})
+        if unverified.get("exp", 0) >= datetime.now(timezone.utc).timestamp():
+            payload = jwt.decode(token, secret, algorithms=["HS256"])
+            result = {
+                "user_id": payload["user_id"],
+                "username": payload["username"],
+            }
+            # Never cache a valid result past the token's own expiry
+            ttl = min(ttl, payload["exp"] - datetime.now(timezone.utc).timestamp())
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError, KeyError):
-        return None
+        result = None
+
+    with _verify_cache_lock:
+        if len(_verify_cache) >= _CACHE_MAX_ENTRIES:
+            _verify_cache.popitem(last=False)
+        _verify_cache[key] = (now + ttl, result)
+    return result
@@ -20,7 +20,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class InboundMessage:
     """A message received from an external channel.
 
@@ -40,20 +40,16 @@ class InboundMessage:
     media: List[Any] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     user_id: str = ""
+    session_key: str = field(init=False, default="")
 
-    @property
-    def session_key(self) -> str:
-        """Generate session key for continuity tracking.
-
-        If user_id is set (authenticated), use it for cross-channel continuity.
-        Otherwise fall back to channel-specific key.
-        """
-        if self.user_id:
-            return self.user_id
-        return f"{self.channel}:{self.chat_id}"
+    def __post_init__(self) -> None:
+        # Session key for continuity tracking, computed once at construction:
+        # user_id when authenticated (cross-channel continuity), otherwise a
+        # channel-specific key. Reads are plain attribute loads afterwards.
+        self.session_key = self.user_id or f"{self.channel}:{self.chat_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundMessage:
     """A response message destined for an external channel.
 
@@ -95,9 +91,14 @@ class MessageBus:
         await bus.publish_outbound(response)
     """
 
-    def __init__(self) -> None:
-        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
-        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
+    DEFAULT_MAXSIZE = 1024
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        # Bounded queues keep memory flat under bursts: when an executor
+        # falls behind, publish_inbound blocks the producing channel instead
+        # of letting the backlog grow without limit.
+        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue(maxsize=maxsize)
+        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue(maxsize=maxsize)
 
     async def publish_inbound(self, msg: InboundMessage) -> None:
         """Publish a user message from a channel into the inbound queue.
@@ -134,3 +135,21 @@ class MessageBus:
             The next outbound message.
         """
         return await self.outbound.get()
+
+    async def consume_outbound_batch(self, max_n: int = 32) -> List[OutboundMessage]:
+        """Consume up to ``max_n`` responses in one wake-up.
+
+        Blocks for the first message, then drains whatever else is already
+        queued without awaiting, so consumers can dispatch a backlog
+        concurrently instead of paying one scheduler wake per message.
+
+        Returns:
+            Between 1 and ``max_n`` outbound messages, in queue order.
+        """
+        msgs = [await self.outbound.get()]
+        while len(msgs) < max_n:
+            try:
+                msgs.append(self.outbound.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return msgs
@@ -9,18 +9,24 @@ Extracted from bot.py. Preserves ALL existing functionality:
 - Machine resolution (multi-machine support)
 """
 
+import functools
+import io
 import json
 import glob
+import heapq
+import os
 import shlex
-import subprocess
+import time
 import asyncio
 import re
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional, Set
 
 from telegram import Update
+from telegram.request import HTTPXRequest
 from telegram.ext import (
     ApplicationBuilder,
     ContextTypes,
@@ -29,14 +35,248 @@ from telegram.ext import (
     filters,
 )
 
+# Optional: orjson parses/serializes several times faster than stdlib json —
+# the pollers touch dozens of order/outbox files per tick.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Optional: transparent rate limiting (needs python-telegram-bot[rate-limiter]).
+# Keeps outbox bursts within Telegram's 30 msg/s global cap and retries
+# RetryAfter responses instead of stalling the poller.
+try:
+    from telegram.ext import AIORateLimiter
+except ImportError:
+    AIORateLimiter = None
+
+# Optional: HTTP/2 support for the Bot API connection pool (needs
+# httpx[http2]). Multiplexes concurrent sends over one connection; without
+# it the pool still reuses HTTP/1.1 connections.
+try:
+    import h2  # noqa: F401 — presence check only
+
+    _HTTP_VERSION = "2"
+except ImportError:
+    _HTTP_VERSION = "1.1"
+
+# Optional: inotify-backed directory watching. When unavailable the pollers
+# fall back to fixed-interval sleeps.
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+# Optional: persistent SSH connections for remote machines. When unavailable
+# every remote command forks the ssh binary (full handshake per command).
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
 from caduceus.channels.base import BaseChannel
 from caduceus.bus import MessageBus, OutboundMessage
-from caduceus.feed_processor import process_feed
-from handlers.paper_handler import add_paper, format_result as format_paper_result
+
+# caduceus.feed_processor and handlers.paper_handler are imported lazily in
+# their handlers: feed_processor pulls in trafilatura/newspaper (seconds of
+# cold import) and neither is needed to start serving commands.
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Machine:
+    """Registered machine entry, fully resolved at registry load.
+
+    Attribute access replaces dict lookups on every poll tick and command,
+    and slots keep per-machine memory flat. ssh_conn caches the persistent
+    asyncssh connection for remote machines.
+    """
+
+    name: str
+    host: str
+    repo_path: Path
+    repo_str: str
+    machine_name: str
+    is_local: bool
+    orders_dir: Path
+    outbox_dir: Path
+    ssh_user: Optional[str] = None
+    ssh_conn: Any = None
+
+
+class PendingOrders:
+    """Pending-order tracking laid out as parallel arrays.
+
+    The acknowledgment loop touches these records on every wake; keeping
+    each field in its own list makes a lookup one dict probe plus plain
+    list indexing, instead of a per-order dict with a hashed lookup per
+    field, and removal swap-pops in O(1). Serializes to and from the same
+    dict-of-dicts shape the tracking file has always used, so existing
+    pending-orders.json files load unchanged.
+    """
+
+    __slots__ = (
+        "_idx", "_paths", "_machines", "_chat_ids", "_texts",
+        "_created", "_delays",
+    )
+
+    def __init__(self) -> None:
+        self._idx: Dict[str, int] = {}
+        self._paths: list = []
+        self._machines: list = []
+        self._chat_ids: list = []
+        self._texts: list = []
+        self._created: list = []
+        self._delays: list = []
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._idx
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def add(self, path: str, machine: str, chat_id, text: str,
+            created_at: Optional[float]) -> None:
+        i = self._idx.get(path)
+        if i is None:
+            self._idx[path] = len(self._paths)
+            self._paths.append(path)
+            self._machines.append(machine)
+            self._chat_ids.append(chat_id)
+            self._texts.append(text)
+            self._created.append(created_at)
+            self._delays.append(None)
+        else:
+            self._machines[i] = machine
+            self._chat_ids[i] = chat_id
+            self._texts[i] = text
+            self._created[i] = created_at
+            self._delays[i] = None
+
+    def pop(self, path: str) -> None:
+        """Remove an entry if present, swapping the last entry into its slot."""
+        i = self._idx.pop(path, None)
+        if i is None:
+            return
+        last = len(self._paths) - 1
+        for arr in (self._paths, self._machines, self._chat_ids,
+                    self._texts, self._created, self._delays):
+            arr[i] = arr[last]
+            arr.pop()
+        if i != last:
+            self._idx[self._paths[i]] = i
+
+    def fields(self, path: str) -> Optional[tuple]:
+        """Return (machine, chat_id, order_text) or None if untracked."""
+        i = self._idx.get(path)
+        if i is None:
+            return None
+        return self._machines[i], self._chat_ids[i], self._texts[i]
+
+    def created_at(self, path: str) -> Optional[float]:
+        i = self._idx.get(path)
+        return None if i is None else self._created[i]
+
+    def bump_delay(self, path: str, initial: float, cap: float) -> Optional[float]:
+        """Double (capped) and return the per-order recheck delay."""
+        i = self._idx.get(path)
+        if i is None:
+            return None
+        delay = min(2 * (self._delays[i] or initial), cap)
+        self._delays[i] = delay
+        return delay
+
+    def to_dict(self) -> Dict[str, Dict]:
+        out: Dict[str, Dict] = {}
+        for i, path in enumerate(self._paths):
+            entry = {
+                "machine": self._machines[i],
+                "chat_id": self._chat_ids[i],
+                "order_text": self._texts[i],
+                "created_at": self._created[i],
+            }
+            if self._delays[i] is not None:
+                entry["check_delay"] = self._delays[i]
+            out[path] = entry
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict]) -> "PendingOrders":
+        pending = cls()
+        for path, tracking in data.items():
+            pending.add(
+                path,
+                tracking.get("machine"),
+                tracking.get("chat_id"),
+                tracking.get("order_text"),
+                tracking.get("created_at"),
+            )
+            pending._delays[pending._idx[path]] = tracking.get("check_delay")
+        return pending
+
+
+# Compiled once — format_response_compact runs per response
+_COLLAPSE_RE = re.compile(r"\n{3,}")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+# Outbox severity → notification emoji (built once, not per message)
+_SEVERITY_EMOJI = {
+    "critical": "🚨",
+    "warning": "⚠️",
+    "info": "ℹ️",
+    "success": "✅",
+    "alert": "🔔",
+}
+
+# Markdown header prefix → section emoji (longest prefix first)
+_HEADER_PREFIXES = (
+    ("### ", "▪️"),
+    ("## ", "📌"),
+    ("# ", "🎯"),
+)
+
+
+def _compact_line(line: str) -> str:
+    """Transform one stripped, non-blank markdown line to Telegram HTML.
+
+    Dispatches on the first character so ordinary prose lines — the vast
+    majority — skip every prefix comparison.
+    """
+    head = line[0]
+    # Convert markdown headers to emoji sections
+    if head == "#":
+        for prefix, icon in _HEADER_PREFIXES:
+            if line.startswith(prefix):
+                return f"<b>{icon} {line[len(prefix):]}</b>"
+    # Convert bold (all runs in the line, in one scan)
+    if "**" in line:
+        return _BOLD_RE.sub(r"<b>\1</b>", line)
+    if head == "-" or head == "✅" or head == "❌":
+        # Status indicators pass through
+        if line.startswith(("- ✅", "✅", "- ❌", "❌")):
+            return line
+        if line.startswith("- "):
+            return f"  {line[2:]}"  # Indent bullets
+    return line
+
+
 class TelegramChannel(BaseChannel):
     """Telegram bot channel implementation.
 
@@ -56,14 +296,76 @@ class TelegramChannel(BaseChannel):
         self.user_store = user_store
 
         self.token = config["telegram_token"]
-        self.authorized: Set[int] = set(config.get("authorized_users", []))
+        self.authorized: frozenset = frozenset(config.get("authorized_users", []))
+        # Bound __contains__ skips a Python-level frame on the auth check
+        # every single update runs through
+        self.is_authorized = self.authorized.__contains__
         self.machines = self._load_machines(config)
+        # Machine configs are immutable at runtime, so the locality filter is
+        # evaluated once here; the poll loop iterates this list directly.
+        self.local_machines = [
+            (name, machine)
+            for name, machine in self.machines.items()
+            if machine.is_local
+        ]
         self.default_machine = config.get("default_machine", next(iter(self.machines)))
+        # The registry never mutates post-init, so the machine list shown in
+        # usage/error replies is joined once here, and the static /help text
+        # is assembled once instead of per command
+        self._machines_str = ", ".join(self.machines.keys())
+        self._help_text = (
+            "🌌 *Galaxy-gazer Commands*\n\n"
+            "`/status [machine|all]` — Machine status (git, tests, reports)\n"
+            "`/concerns [machine|all]` — Latest Stargazer concerns\n"
+            "`/feed <url> [note]` — Ingest reference into knowledge archive\n"
+            "`/paper <doi|url> [note]` — Add academic paper to Zotero\n"
+            "`/stars <action>` — Manage GitHub star lists\n"
+            "`/order [machine|all] <msg>` — Send order (progress updates every 60s, 10 min timeout)\n"
+            "`/machines` — List registered machines\n"
+            "`/help` — This message\n\n"
+            f"📍 Machines: `{self._machines_str}`\n"
+            f"📍 Default: `{self.default_machine}`"
+        )
         self.poll_interval = config.get("poll_interval", 30)
         self.config = config
 
-        # Track pending orders for acknowledgment polling
-        self.pending_orders: Dict[str, Dict] = {}
+        # Track pending orders for acknowledgment polling. Persisted to disk
+        # so a bot restart doesn't lose tracking, and TTL-evicted so orders
+        # that are never acknowledged can't accumulate forever.
+        self._pending_orders_path = Path(
+            config.get("pending_orders_path", ".galaxy/pending-orders.json")
+        )
+        self.pending_orders: PendingOrders = self._load_pending_orders()
+
+        # Due-time heap over pending orders: each tick only checks entries
+        # whose next_check has elapsed, with exponential backoff between
+        # checks, instead of stat+parse of every pending order every tick.
+        self._ack_queue: list = [(0.0, order_file) for order_file in self.pending_orders]
+        heapq.heapify(self._ack_queue)
+
+        # Outbox files already delivered — skipped without re-opening on
+        # subsequent polls (sent files are never removed from the directory)
+        self._outbox_sent: Set[str] = set()
+
+        # Caps concurrent outbox sends under Telegram's ~30 msg/s global
+        # limit when many recipients are fanned out at once
+        self._send_sem = asyncio.Semaphore(20)
+
+        # Per-chat outbound coalescing: send() enqueues and a short-lived
+        # writer concatenates everything arriving within the window into
+        # one send_message call (see SEND_COALESCE_SECONDS)
+        self._send_queues: Dict[str, asyncio.Queue] = {}
+        self._send_writers: Dict[str, asyncio.Task] = {}
+
+        # message_id of the last progress notification per (chat, order):
+        # heartbeats edit it in place instead of stacking new messages
+        self._progress_msgs: Dict[tuple, int] = {}
+
+        # Stargazer report caches, invalidated by mtime: directory listings
+        # keyed on the notepads root, file contents keyed per file
+        self._report_cache: Dict[str, Dict] = {}
+        self._json_cache: Dict[str, tuple] = {}
+        self._text_cache: Dict[str, tuple] = {}
 
         self.app = None
         self.digest_scheduler = None
@@ -89,83 +391,191 @@ class TelegramChannel(BaseChannel):
     # --- MACHINE REGISTRY ---
 
     @staticmethod
-    def _load_machines(config: Dict) -> Dict[str, Dict]:
+    def _build_machine(name: str, host: str, repo_path: Path, machine_name: str,
+                       ssh_user: Optional[str] = None) -> Machine:
+        """Resolve one machine entry, precomputing derived paths and locality."""
+        return Machine(
+            name=name,
+            host=host,
+            repo_path=repo_path,
+            repo_str=str(repo_path),
+            machine_name=machine_name,
+            is_local=TelegramChannel.is_local({"host": host}),
+            orders_dir=repo_path / ".sisyphus" / "notepads" / "galaxy-orders",
+            outbox_dir=repo_path / ".sisyphus" / "notepads" / "galaxy-outbox",
+            ssh_user=ssh_user,
+        )
+
+    @staticmethod
+    def _load_machines(config: Dict) -> Dict[str, Machine]:
         """Load machine registry from config.
 
         Supports two formats:
         - New: { "machines": { "lab": { "host": "localhost", "repo_path": "..." } } }
         - Legacy: { "machine_name": "lab", "repo_path": "..." }
 
-        Returns dict of { name: { host, repo_path, machine_name } }
+        Returns dict of { name: Machine }. Derived fields (is_local, orders
+        and outbox dirs) are resolved once here so hot paths read attributes
+        instead of rebuilding Path objects every iteration.
         """
         if "machines" in config:
-            machines = {}
-            for name, entry in config["machines"].items():
-                machines[name] = {
-                    "host": entry.get("host", "localhost"),
-                    "repo_path": Path(entry["repo_path"]),
-                    "machine_name": entry.get("machine_name", name),
-                }
-            return machines
+            return {
+                name: TelegramChannel._build_machine(
+                    name=name,
+                    host=entry.get("host", "localhost"),
+                    repo_path=Path(entry["repo_path"]),
+                    machine_name=entry.get("machine_name", name),
+                    ssh_user=entry.get("ssh_user"),
+                )
+                for name, entry in config["machines"].items()
+            }
 
         # Legacy single-machine format
         name = config.get("machine_name", "local")
         return {
-            name: {
-                "host": "localhost",
-                "repo_path": Path(config.get("repo_path", str(Path(__file__).parent.parent.parent.parent))),
-                "machine_name": name,
-            }
+            name: TelegramChannel._build_machine(
+                name=name,
+                host="localhost",
+                repo_path=Path(config.get("repo_path", str(Path(__file__).parent.parent.parent.parent))),
+                machine_name=name,
+            )
         }
 
     # --- AUTH ---
 
-    def is_authorized(self, user_id: int) -> bool:
-        return user_id in self.authorized
+    # is_authorized is bound in __init__ as self.authorized.__contains__
 
     # --- FORMATTING ---
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def format_response_compact(text: str) -> str:
-        """Convert markdown response to compact emoji-rich format for Telegram HTML."""
-        lines = text.strip().split("\n")
-        output = []
+        """Convert markdown response to compact emoji-rich format for Telegram HTML.
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        Deterministic in its input, so results are memoized — the ack poller
+        in particular can format the same response text more than once.
+        """
+        # splitlines() handles all newline forms in one C pass, and the
+        # generator feeds join directly — no intermediate output list.
+        result = _COLLAPSE_RE.sub(
+            "\n\n",
+            "\n".join(
+                _compact_line(stripped)
+                for line in text.splitlines()
+                if (stripped := line.strip()) and stripped != "---"
+            ),
+        )
 
-            # Convert markdown headers to emoji sections
-            if line.startswith("# "):
-                output.append(f"<b>🎯 {line[2:]}</b>")
-            elif line.startswith("## "):
-                output.append(f"<b>📌 {line[3:]}</b>")
-            elif line.startswith("### "):
-                output.append(f"<b>▪️ {line[4:]}</b>")
-            # Convert bold
-            elif "**" in line:
-                line = line.replace("**", "<b>", 1).replace("**", "</b>", 1)
-                output.append(line)
-            # Convert status indicators
-            elif line.startswith("- ✅") or line.startswith("✅"):
-                output.append(line)
-            elif line.startswith("- ❌") or line.startswith("❌"):
-                output.append(line)
-            elif line.startswith("- "):
-                output.append(f"  {line[2:]}")  # Indent bullets
-            # Skip markdown separators
-            elif line == "---":
-                continue
-            # Keep everything else
-            else:
-                output.append(line)
+        return result[:1500]  # Hard cap for sanity
 
-        # Join with single newlines, collapse multiple blanks
-        result = "\n".join(output)
-        result = re.sub(r"\n{3,}", "\n\n", result)
+    # --- FILESYSTEM HELPERS ---
 
-        return result[:1500]  # Hard cap for sanity
+    @staticmethod
+    def _scan_json_files(directory, skip: Set[str]) -> list:
+        """Blocking single-directory scan for .json files not in `skip`.
+
+        One scandir pass instead of a glob; call via asyncio.to_thread.
+        Files with a sibling ``.sent`` marker are already delivered and
+        skipped without being opened.
+        """
+        paths = []
+        sent_markers = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".sent"):
+                    sent_markers.add(entry.path[: -len(".sent")])
+                elif entry.name.endswith(".json") and entry.path not in skip:
+                    paths.append(entry.path)
+        paths = [p for p in paths if p not in sent_markers]
+        paths.sort()
+        return paths
+
+    @staticmethod
+    def _read_json(path) -> Dict:
+        """Blocking JSON file read — call via asyncio.to_thread from async code."""
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+
+    @staticmethod
+    def _write_json(path, data: Dict) -> None:
+        """Blocking JSON file write — call via asyncio.to_thread from async code."""
+        with open(path, "w") as f:
+            f.write(_json_dumps(data))
+
+    @staticmethod
+    def _read_text(path) -> str:
+        """Blocking text file read — call via asyncio.to_thread from async code."""
+        with open(path) as f:
+            return f.read()
+
+    def _latest_report_files(self, machine_name: str, repo: Path, filename: str) -> list:
+        """Blocking lookup of stargazer report files, newest last.
+
+        New reports create new stargazer-* directories, which bumps the
+        notepads root mtime — so the glob is only re-run when that mtime
+        changes. Call via asyncio.to_thread.
+        """
+        notepads = repo / ".sisyphus" / "notepads"
+        try:
+            root_mtime = os.stat(notepads).st_mtime
+        except OSError:
+            return []
+
+        cache = self._report_cache.setdefault(machine_name, {})
+        entry = cache.get(filename)
+        if entry is None or entry["root_mtime"] != root_mtime or not entry["files"]:
+            files = sorted(glob.glob(str(notepads / f"stargazer-*/{filename}")))
+            entry = {"root_mtime": root_mtime, "files": files}
+            cache[filename] = entry
+        return entry["files"]
+
+    @staticmethod
+    def _latest_response_file(notepads: Path) -> Optional[str]:
+        """Blocking lookup of the newest order-response notepad, or None.
+
+        One scandir pass tracking the max name beats glob + sort — response
+        names embed their timestamp, so lexicographic max is newest. Call
+        via asyncio.to_thread.
+        """
+        latest = None
+        try:
+            with os.scandir(notepads) as entries:
+                for entry in entries:
+                    if (
+                        entry.name.startswith("galaxy-order-response-")
+                        and entry.name.endswith(".md")
+                        and (latest is None or entry.name > latest.name)
+                    ):
+                        latest = entry
+        except OSError:
+            return None
+        return latest.path if latest else None
+
+    def _read_json_cached(self, path) -> Dict:
+        """Blocking JSON read with (path, mtime) caching — call via
+        asyncio.to_thread. Reparses only when the file changes on disk."""
+        path = str(path)
+        # Nanosecond mtime: executors can acknowledge within the same
+        # second the order was written, which a float mtime can miss
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._json_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        data = self._read_json(path)
+        self._json_cache[path] = (mtime, data)
+        return data
+
+    def _read_text_cached(self, path) -> str:
+        """Blocking text read with (path, mtime) caching — call via
+        asyncio.to_thread."""
+        path = str(path)
+        mtime = os.stat(path).st_mtime
+        cached = self._text_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        content = self._read_text(path)
+        self._text_cache[path] = (mtime, content)
+        return content
 
     # --- MACHINE HELPERS ---
 
@@ -179,67 +589,158 @@ class TelegramChannel(BaseChannel):
 
     @staticmethod
     def is_local(machine: Dict) -> bool:
-        """Check if a machine config points to localhost."""
+        """Check if a raw machine config dict points to localhost.
+
+        Hot paths read the precomputed Machine.is_local attribute instead.
+        """
         return machine["host"] in ("localhost", "127.0.0.1", "")
 
     @staticmethod
-    def run_on_machine(machine: Dict, cmd: list):
+    @functools.lru_cache(maxsize=1)
+    def _ssh_control_dir() -> str:
+        """Directory for SSH ControlMaster sockets, created on first use."""
+        control_dir = Path.home() / ".cache" / "caduceus" / "ssh-cm"
+        control_dir.mkdir(parents=True, exist_ok=True)
+        os.chmod(control_dir, 0o700)
+        return str(control_dir)
+
+    @staticmethod
+    async def run_on_machine(machine: Machine, cmd: list):
         """Run a command on a machine. Local = subprocess, remote = ssh.
 
+        Spawns via asyncio so shells never block the event loop (the outbox
+        and ack pollers keep running while git/pytest execute).
+
         Returns (stdout, stderr, returncode).
         """
-        repo = str(machine["repo_path"])
-
-        if TelegramChannel.is_local(machine):
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=repo, timeout=30)
-            return result.stdout.strip(), result.stderr.strip(), result.returncode
-
-        # Remote: SSH
-        host = machine["host"]
-        ssh_user = machine.get("ssh_user", "")
-        target = f"{ssh_user}@{host}" if ssh_user else host
-        ssh_cmd = [
-            "ssh",
-            "-o",
-            "ConnectTimeout=5",
-            target,
-            f"cd {shlex.quote(str(repo))} && {' '.join(shlex.quote(c) for c in cmd)}",
-        ]
+        repo = machine.repo_str
 
-        result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=30)
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
+        if machine.is_local:
+            exec_cmd = cmd
+            cwd = repo
+        else:
+            # Remote: prefer a persistent asyncssh connection (one handshake
+            # amortized over the bot's lifetime), fall back to the ssh binary
+            if asyncssh is not None:
+                try:
+                    return await TelegramChannel._run_via_asyncssh(machine, cmd)
+                except Exception as e:
+                    logger.debug(f"asyncssh failed, falling back to ssh binary: {e}")
+
+            host = machine.host
+            ssh_user = machine.ssh_user or ""
+            target = f"{ssh_user}@{host}" if ssh_user else host
+            exec_cmd = [
+                "ssh",
+                "-o",
+                "ConnectTimeout=5",
+                # ControlMaster multiplexing: consecutive commands to the
+                # same host share one TCP/KEX session for 60s instead of
+                # paying a full handshake each
+                "-o",
+                "ControlMaster=auto",
+                "-o",
+                f"ControlPath={TelegramChannel._ssh_control_dir()}/%C",
+                "-o",
+                "ControlPersist=60s",
+                target,
+                f"cd {shlex.quote(repo)} && {' '.join(shlex.quote(c) for c in cmd)}",
+            ]
+            cwd = None
+
+        proc = await asyncio.create_subprocess_exec(
+            *exec_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return (
+            stdout.decode(errors="replace").strip(),
+            stderr.decode(errors="replace").strip(),
+            proc.returncode,
+        )
+
+    @staticmethod
+    async def _run_via_asyncssh(machine: Machine, cmd: list):
+        """Run a remote command over a cached asyncssh connection.
+
+        The connection is stored in the machine dict and reused across
+        commands; a dead connection is dropped and re-established once.
+        """
+        command = (
+            f"cd {shlex.quote(machine.repo_str)} && "
+            f"{' '.join(shlex.quote(c) for c in cmd)}"
+        )
+        conn = machine.ssh_conn
+        for attempt in (0, 1):
+            if conn is None:
+                conn = await asyncssh.connect(
+                    machine.host,
+                    username=machine.ssh_user,
+                    keepalive_interval=30,
+                )
+                machine.ssh_conn = conn
+            try:
+                result = await asyncio.wait_for(conn.run(command), timeout=30)
+                return (
+                    (result.stdout or "").strip(),
+                    (result.stderr or "").strip(),
+                    result.exit_status,
+                )
+            except (asyncssh.Error, OSError):
+                machine.ssh_conn = None
+                conn = None
+                if attempt:
+                    raise
 
     # --- STATUS HELPERS ---
 
-    def get_status_text(self, name: str, machine: Dict) -> str:
+    async def get_status_text(self, name: str, machine: Machine) -> str:
         """Build status text for a single machine."""
+        # One invocation for all three probes: a single process spawn (and,
+        # for remotes, a single ssh session) instead of three, with the
+        # outputs split on a delimiter
         try:
-            git_log, _, _ = self.run_on_machine(machine, ["git", "log", "--oneline", "-5"])
+            stdout, _, _ = await self.run_on_machine(
+                machine,
+                [
+                    "sh",
+                    "-c",
+                    "git log --oneline -5; echo __SEP__; "
+                    "git status --short; echo __SEP__; "
+                    "python3 -m pytest tests/ -q --tb=no 2>/dev/null | tail -1",
+                ],
+            )
+            parts = [p.strip() for p in stdout.split("__SEP__")]
         except Exception:
-            git_log = "(git unavailable)"
+            parts = []
 
-        try:
-            git_status, _, _ = self.run_on_machine(machine, ["git", "status", "--short"])
-            git_status = git_status or "(clean)"
-        except Exception:
+        if len(parts) == 3:
+            git_log = parts[0] or "(git unavailable)"
+            git_status = parts[1] or "(clean)"
+            test_line = parts[2] or "unknown"
+        else:
+            git_log = "(git unavailable)"
             git_status = "(unknown)"
-
-        try:
-            stdout, _, _ = self.run_on_machine(machine, ["python3", "-m", "pytest", "tests/", "-q", "--tb=no"])
-            test_line = stdout.split("\n")[-1] if stdout else "unknown"
-        except Exception:
             test_line = "(pytest unavailable)"
 
         # Stargazer reports (local only)
         report_summary = "No reports"
-        if self.is_local(machine):
-            repo = machine["repo_path"]
-            reports = sorted(glob.glob(str(repo / ".sisyphus/notepads/stargazer-*/meta.json")))
+        if machine.is_local:
+            repo = machine.repo_path
+            reports = await asyncio.to_thread(
+                self._latest_report_files, name, repo, "meta.json"
+            )
             if reports:
                 report_summary = f"{len(reports)} report(s)"
                 try:
-                    with open(reports[-1]) as f:
-                        latest = json.load(f)
+                    latest = await asyncio.to_thread(self._read_json_cached, reports[-1])
                     critical = latest.get("critical_concerns", 0)
                     warnings = latest.get("warning_concerns", 0)
                     report_summary += f"\nLatest: {critical} critical, {warnings} warnings"
@@ -255,19 +756,20 @@ class TelegramChannel(BaseChannel):
             f"*Time:* {datetime.now().strftime('%H:%M:%S')}"
         )
 
-    def get_concerns_text(self, name: str, machine: Dict) -> str:
+    async def get_concerns_text(self, name: str, machine: Machine) -> str:
         """Get concerns text for a single machine (local only)."""
-        if not self.is_local(machine):
+        if not machine.is_local:
             return f"⚠️ *{name}*: concerns only available for local machines"
 
-        repo = machine["repo_path"]
-        problems_files = sorted(glob.glob(str(repo / ".sisyphus/notepads/stargazer-*/problems.md")))
+        repo = machine.repo_path
+        problems_files = await asyncio.to_thread(
+            self._latest_report_files, name, repo, "problems.md"
+        )
 
         if not problems_files:
             return f"✅ *{name}*: No Stargazer concerns on file."
 
-        with open(problems_files[-1]) as f:
-            content = f.read()
+        content = await asyncio.to_thread(self._read_text_cached, problems_files[-1])
 
         if len(content) > 3500:
             content = content[:3500] + "\n\n... (truncated, see full in notepads)"
@@ -276,20 +778,22 @@ class TelegramChannel(BaseChannel):
 
     # --- ORDER HELPERS ---
 
-    def create_order(self, machine_name: str, machine_config: Dict, order_text: str, chat_id: int) -> Optional[str]:
+    def create_order(self, machine_name: str, machine_config: Machine, order_text: str, chat_id: int) -> Optional[str]:
         """Write an order JSON file. Returns the order file path or None."""
-        if not self.is_local(machine_config):
+        if not machine_config.is_local:
             return None
 
-        orders_dir = machine_config["repo_path"] / ".sisyphus" / "notepads" / "galaxy-orders"
+        orders_dir = machine_config.orders_dir
         orders_dir.mkdir(parents=True, exist_ok=True)
 
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        # One clock read serves both the timestamp field and the filename
+        now = datetime.now(timezone.utc)
+        ts = now.strftime("%Y%m%d-%H%M%S")
         order_id = f"telegram:{chat_id}"
 
         order = {
             "payload": order_text,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now.isoformat(),
             "order_id": order_id,
             "sender_id": str(chat_id),
             "chat_id": str(chat_id),
@@ -299,10 +803,82 @@ class TelegramChannel(BaseChannel):
 
         order_file = orders_dir / f"{ts}.json"
         with open(order_file, "w") as f:
-            json.dump(order, f, indent=2)
+            f.write(_json_dumps(order))
 
         return str(order_file)
 
+    def _write_order_sync(self, name: str, machine: Machine, order_text: str) -> Path:
+        """Blocking write of a galaxy_order JSON file for one machine.
+
+        Call via asyncio.to_thread from async code so the mkdir + write
+        don't hold the event loop.
+        """
+        orders_dir = machine.orders_dir
+        orders_dir.mkdir(parents=True, exist_ok=True)
+
+        # One clock read serves both the timestamp field and the filename
+        now = datetime.now(timezone.utc)
+        order = {
+            "type": "galaxy_order",
+            "from": "galaxy-gazer",
+            "target": name,
+            "command": "general",
+            "payload": order_text,
+            "timestamp": now.isoformat(),
+            "acknowledged": False,
+        }
+
+        order_file = orders_dir / f"{now.strftime('%Y%m%d-%H%M%S')}.json"
+        with open(order_file, "w") as f:
+            f.write(_json_dumps(order))
+        return order_file
+
+    # --- PENDING ORDER TRACKING ---
+
+    # Evict pending orders that were never acknowledged after this long
+    PENDING_ORDER_TTL_SECONDS = 86400
+
+    # Cap on the exponential backoff between acknowledgment checks
+    ACK_BACKOFF_MAX_SECONDS = 300
+
+    def _load_pending_orders(self) -> PendingOrders:
+        """Load persisted pending-order tracking from disk."""
+        try:
+            data = _json_loads(self._pending_orders_path.read_bytes())
+            if isinstance(data, dict):
+                return PendingOrders.from_dict(data)
+        except (ValueError, OSError):
+            pass
+        return PendingOrders()
+
+    def _save_pending_orders(self) -> None:
+        """Blocking write of pending-order tracking — call via asyncio.to_thread
+        from async code."""
+        try:
+            self._pending_orders_path.parent.mkdir(parents=True, exist_ok=True)
+            self._pending_orders_path.write_text(
+                _json_dumps(self.pending_orders.to_dict())
+            )
+        except OSError as e:
+            logger.warning(f"[pending] Failed to persist pending orders: {e}")
+
+    def _track_order(self, order_file: str, machine: str, chat_id: int, order_text: str) -> None:
+        """Record an order for acknowledgment polling and persist the tracking."""
+        self.pending_orders.add(
+            order_file, machine, chat_id, order_text,
+            datetime.now(timezone.utc).timestamp(),
+        )
+        heapq.heappush(self._ack_queue, (0.0, order_file))
+        self._save_pending_orders()
+
+    def _is_expired(self, created_at: Optional[float]) -> bool:
+        if created_at is None:
+            return False
+        return (
+            datetime.now(timezone.utc).timestamp() - created_at
+            > self.PENDING_ORDER_TTL_SECONDS
+        )
+
     # --- TELEGRAM HANDLERS ---
 
     async def _on_text(self, update: Update, ctx: ContextTypes.DEFAULT_TYPE):
@@ -325,11 +901,7 @@ class TelegramChannel(BaseChannel):
         order_file = self.create_order(name, machine, order_text, update.effective_chat.id)
 
         if order_file:
-            self.pending_orders[order_file] = {
-                "machine": name,
-                "chat_id": update.effective_chat.id,
-                "order_text": order_text,
-            }
+            self._track_order(order_file, name, update.effective_chat.id, order_text)
             await update.message.reply_text(f"\U0001f4e1 \u2192 *{name}*", parse_mode="Markdown")
 
         # Note: MessageBus publishing disabled - using filesystem bridge (Hermes)
@@ -351,24 +923,28 @@ class TelegramChannel(BaseChannel):
         target = ctx.args[0] if ctx.args else None
 
         if target == "all":
+            names = list(self.machines.keys())
+            results = await asyncio.gather(
+                *(self.get_status_text(n, self.machines[n]) for n in names),
+                return_exceptions=True,
+            )
             parts = []
-            for name, machine in self.machines.items():
-                try:
-                    parts.append(self.get_status_text(name, machine))
-                except Exception as e:
-                    parts.append(f"📊 *{name}*: ❌ unreachable ({e})")
+            for name, result in zip(names, results):
+                if isinstance(result, BaseException):
+                    parts.append(f"📊 *{name}*: ❌ unreachable ({result})")
+                else:
+                    parts.append(result)
             msg = "\n\n---\n\n".join(parts)
         else:
             name, machine = self.resolve_machine(target)
             if machine is None:
-                available = ", ".join(self.machines.keys())
                 await update.message.reply_text(
-                    f"❌ Unknown machine `{target}`\nAvailable: `{available}`",
+                    f"❌ Unknown machine `{target}`\nAvailable: `{self._machines_str}`",
                     parse_mode="Markdown",
                 )
                 return
             try:
-                msg = self.get_status_text(name, machine)
+                msg = await self.get_status_text(name, machine)
             except Exception as e:
                 msg = f"📊 *{name}*: ❌ unreachable ({e})"
 
@@ -388,20 +964,27 @@ class TelegramChannel(BaseChannel):
         target = ctx.args[0] if ctx.args else None
 
         if target == "all":
-            parts = []
-            for name, machine in self.machines.items():
-                parts.append(self.get_concerns_text(name, machine))
+            names = list(self.machines.keys())
+            results = await asyncio.gather(
+                *(self.get_concerns_text(n, self.machines[n]) for n in names),
+                return_exceptions=True,
+            )
+            parts = [
+                f"📋 *{name}*: ❌ unreachable ({result})"
+                if isinstance(result, BaseException)
+                else result
+                for name, result in zip(names, results)
+            ]
             msg = "\n\n---\n\n".join(parts)
         else:
             name, machine = self.resolve_machine(target)
             if machine is None:
-                available = ", ".join(self.machines.keys())
                 await update.message.reply_text(
-                    f"❌ Unknown machine `{target}`\nAvailable: `{available}`",
+                    f"❌ Unknown machine `{target}`\nAvailable: `{self._machines_str}`",
                     parse_mode="Markdown",
                 )
                 return
-            msg = self.get_concerns_text(name, machine)
+            msg = await self.get_concerns_text(name, machine)
 
         if len(msg) > 4000:
             msg = msg[:4000] + "\n\n... (truncated)"
@@ -444,7 +1027,9 @@ class TelegramChannel(BaseChannel):
             await self.app.bot.send_message(chat_id, "❌ Failed: no default machine")
             return
 
-        references_dir = machine["repo_path"] / ".sisyphus" / "references"
+        from caduceus.feed_processor import process_feed
+
+        references_dir = machine.repo_path / ".sisyphus" / "references"
         result = await process_feed(url, note, "telegram", references_dir)
 
         if result.get("error"):
@@ -485,6 +1070,8 @@ class TelegramChannel(BaseChannel):
         if not self.app:
             return
 
+        from handlers.paper_handler import add_paper, format_result as format_paper_result
+
         result = await add_paper(identifier, note=note, config=self.config)
         await self.app.bot.send_message(chat_id, format_paper_result(result))
 
@@ -494,10 +1081,9 @@ class TelegramChannel(BaseChannel):
             return
 
         if not ctx.args:
-            available = ", ".join(self.machines.keys())
             await update.message.reply_text(
                 "Usage: `/order [machine] <message>`\n"
-                f"Machines: `{available}`\n"
+                f"Machines: `{self._machines_str}`\n"
                 "Example: `/order focus on tools/metrics/ changes`\n"
                 "Example: `/order lab-server check test regressions`\n"
                 "Example: `/order all pause until further notice`",
@@ -520,35 +1106,23 @@ class TelegramChannel(BaseChannel):
             await update.message.reply_text("❌ Order message cannot be empty.")
             return
 
+        local_targets = [(n, m) for n, m in targets if m.is_local]
+        remote_targets = [n for n, m in targets if not m.is_local]
+
+        # Fan the blocking writes out to threads so /order all completes in
+        # one disk-latency window instead of one per machine.
+        order_files = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._write_order_sync, n, m, order_text)
+                for n, m in local_targets
+            )
+        )
+
         delivered = []
-        for name, machine in targets:
-            if self.is_local(machine):
-                orders_dir = machine["repo_path"] / ".sisyphus" / "notepads" / "galaxy-orders"
-                orders_dir.mkdir(parents=True, exist_ok=True)
-
-                order = {
-                    "type": "galaxy_order",
-                    "from": "galaxy-gazer",
-                    "target": name,
-                    "command": "general",
-                    "payload": order_text,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "acknowledged": False,
-                }
-
-                ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-                order_file = orders_dir / f"{ts}.json"
-                with open(order_file, "w") as f:
-                    json.dump(order, f, indent=2)
-                delivered.append(name)
-
-                self.pending_orders[str(order_file)] = {
-                    "machine": name,
-                    "chat_id": update.effective_chat.id,
-                    "order_text": order_text,
-                }
-            else:
-                delivered.append(f"{name} (remote — pending SSH)")
+        for (name, _machine), order_file in zip(local_targets, order_files):
+            delivered.append(name)
+            self._track_order(str(order_file), name, update.effective_chat.id, order_text)
+        delivered.extend(f"{name} (remote — pending SSH)" for name in remote_targets)
 
         targets_str = ", ".join(delivered)
         await update.message.reply_text(
@@ -563,8 +1137,8 @@ class TelegramChannel(BaseChannel):
 
         lines = ["🖥️ *Registered Machines*\n"]
         for name, machine in self.machines.items():
-            host = machine["host"]
-            local = "📍 local" if self.is_local(machine) else f"🌐 {host}"
+            host = machine.host
+            local = "📍 local" if machine.is_local else f"🌐 {host}"
             default = " _(default)_" if name == self.default_machine else ""
             lines.append(f"• `{name}` — {local}{default}")
 
@@ -598,11 +1172,7 @@ class TelegramChannel(BaseChannel):
         order_file = self.create_order(machine_name, machine, order_text, update.effective_chat.id)
 
         if order_file:
-            self.pending_orders[order_file] = {
-                "machine": machine_name,
-                "chat_id": update.effective_chat.id,
-                "order_text": order_text,
-            }
+            self._track_order(order_file, machine_name, update.effective_chat.id, order_text)
             await update.message.reply_text(
                 f"⭐ Processing: `/stars {action}`",
                 parse_mode="Markdown",
@@ -618,249 +1188,370 @@ class TelegramChannel(BaseChannel):
         if not self.is_authorized(update.effective_user.id):
             return
 
-        available = ", ".join(self.machines.keys())
-        await update.message.reply_text(
-            "🌌 *Galaxy-gazer Commands*\n\n"
-            "`/status [machine|all]` — Machine status (git, tests, reports)\n"
-            "`/concerns [machine|all]` — Latest Stargazer concerns\n"
-            "`/feed <url> [note]` — Ingest reference into knowledge archive\n"
-            "`/paper <doi|url> [note]` — Add academic paper to Zotero\n"
-            "`/stars <action>` — Manage GitHub star lists\n"
-            "`/order [machine|all] <msg>` — Send order (progress updates every 60s, 10 min timeout)\n"
-            "`/machines` — List registered machines\n"
-            "`/help` — This message\n\n"
-            f"📍 Machines: `{available}`\n"
-            f"📍 Default: `{self.default_machine}`",
-            parse_mode="Markdown",
-        )
+        await update.message.reply_text(self._help_text, parse_mode="Markdown")
 
     # --- BACKGROUND POLLING ---
 
-    async def poll_outbox_messages(self):
-        """Background task: Check for proactive messages from agents."""
+    # Slow fallback tick when event-driven watching is active, so missed
+    # filesystem events never stall a message for more than this long.
+    WATCH_FALLBACK_SECONDS = 300
+
+    async def _sleep_or_watch(self, directories, interval: float):
+        """Wait for filesystem changes under `directories`, or a timeout.
+
+        With watchfiles available this returns as soon as anything changes
+        (sub-second reaction, near-zero idle CPU) and uses a slow fallback
+        tick; otherwise it degrades to a plain fixed-interval sleep.
+        """
+        watchable = [str(d) for d in directories if Path(d).is_dir()]
+        if awatch is None or not watchable:
+            await asyncio.sleep(interval)
+            return
+
+        stop_event = asyncio.Event()
+        timer = asyncio.get_running_loop().call_later(
+            self.WATCH_FALLBACK_SECONDS, stop_event.set
+        )
+        try:
+            async for _changes in awatch(*watchable, stop_event=stop_event):
+                break
+        except Exception as e:
+            logger.debug(f"[watch] falling back to sleep: {e}")
+            await asyncio.sleep(interval)
+        finally:
+            timer.cancel()
+
+    @staticmethod
+    def _split_chunks(text: str, limit: int = 4000) -> list:
+        """Split text into <= limit chunks, preferring newline boundaries.
+
+        Walks the string with monotonically increasing indices — one slice
+        per emitted chunk — instead of repeatedly re-slicing the remainder.
+        """
+        chunks = []
+        start = 0
+        n = len(text)
+        while n - start > limit:
+            split_at = text.rfind("\n", start, start + limit)
+            if split_at - start < 2000:
+                split_at = start + limit
+            chunks.append(text[start:split_at])
+            start = split_at
+            while start < n and text[start] == "\n":
+                start += 1
+        if start < n:
+            chunks.append(text[start:])
+        return chunks
+
+    async def _send_chunks(self, user_id, chunks):
+        """Send message chunks to one user sequentially (preserves ordering).
+
+        Different users are dispatched concurrently by the caller, so N users
+        cost one user's worth of round trips instead of N.
+        """
+        for chunk in chunks:
+            async with self._send_sem:
+                try:
+                    await self.app.bot.send_message(
+                        chat_id=user_id,
+                        text=chunk,
+                        parse_mode="Markdown",
+                    )
+                except Exception:
+                    try:
+                        await self.app.bot.send_message(chat_id=user_id, text=chunk)
+                    except Exception as e:
+                        logger.error(f"[outbox] Failed to send to {user_id}: {e}")
+
+    async def poll_loop(self):
+        """Background task: service outbox messages and order acknowledgments.
+
+        A single watcher over all local order and outbox directories replaces
+        the two independent sleep loops this used to be — one scheduler wake
+        and one directory scan per tick instead of two of each.
+        """
         logger.info(
-            "[outbox] poll_outbox_messages task started, polling every %.1f seconds",
+            "[poll] unified poll loop started, fallback tick every %.1f seconds",
             self.poll_interval / 2,
         )
+        # Watch the notepads root too: acknowledgment responses are written
+        # there, so the ack pass fires on the completion event instead of
+        # waiting out the fallback tick.
+        watch_dirs = [
+            d
+            for _, machine in self.local_machines
+            for d in (
+                machine.orders_dir,
+                machine.outbox_dir,
+                machine.repo_path / ".sisyphus" / "notepads",
+            )
+        ]
         while True:
-            await asyncio.sleep(self.poll_interval / 2)
-            logger.debug("[outbox] Polling outbox directory")
+            await self._sleep_or_watch(watch_dirs, self.poll_interval / 2)
+            await self._service_outbox()
+            await self._service_acknowledgments()
 
-            for machine_name, machine_config in self.machines.items():
-                if not self.is_local(machine_config):
-                    continue
+    async def _service_outbox(self):
+        """One pass over local outbox directories: send unsent messages."""
+        logger.debug("[outbox] Polling outbox directory")
 
-                repo = machine_config["repo_path"]
-                outbox_dir = repo / ".sisyphus/notepads/galaxy-outbox"
+        for machine_name, machine_config in self.local_machines:
+            outbox_dir = machine_config.outbox_dir
 
-                if not outbox_dir.exists():
-                    continue
+            if not outbox_dir.exists():
+                continue
 
-                outbox_files = sorted(glob.glob(str(outbox_dir / "*.json")))
+            outbox_files = await asyncio.to_thread(
+                self._scan_json_files, outbox_dir, self._outbox_sent
+            )
 
-                for outbox_file in outbox_files:
-                    try:
-                        with open(outbox_file) as f:
-                            msg_data = json.load(f)
+            for outbox_file in outbox_files:
+                try:
+                    msg_data = await asyncio.to_thread(self._read_json, outbox_file)
+
+                    if msg_data.get("sent"):
+                        self._outbox_sent.add(outbox_file)
+                        continue
+
+                    severity = msg_data.get("severity", "info")
+                    from_agent = msg_data.get("from", machine_name)
+                    message = msg_data.get("message", "")
+
+                    emoji = _SEVERITY_EMOJI.get(severity, "📬")
+
+                    order_payload = msg_data.get("order_payload", "")
+                    if order_payload:
+                        header = f"{emoji} *{from_agent}*\n\U0001f4e8 _{order_payload[:100]}_\n\n"
+                    else:
+                        header = f"{emoji} *{from_agent}*\n\n"
+
+                    chunks = self._split_chunks(header + message)
+
+                    # Send to specific chat_id if present, otherwise all authorized
+                    target_chat = msg_data.get("chat_id")
+                    recipients = [target_chat] if target_chat else self.authorized
+
+                    order_id = msg_data.get("order_id")
+                    if order_id and target_chat and len(chunks) == 1:
+                        # Progress notification for one order: edit the
+                        # previous status message in place instead of
+                        # stacking a new one per heartbeat
+                        await self._send_progress(target_chat, order_id, chunks[0])
+                    else:
+                        # Fan out across recipients; chunks stay ordered per user
+                        await asyncio.gather(
+                            *(self._send_chunks(user_id, chunks) for user_id in recipients)
+                        )
+
+                    # Sidecar marker instead of rewriting the whole JSON:
+                    # one inode create replaces a read-modify-write cycle.
+                    await asyncio.to_thread(
+                        Path(outbox_file + ".sent").write_text,
+                        datetime.now(timezone.utc).isoformat(),
+                    )
+                    self._outbox_sent.add(outbox_file)
+
+                    logger.info(f"[outbox] Sent message from {machine_name}/{from_agent}")
 
-                        if msg_data.get("sent"):
-                            continue
+                except Exception as e:
+                    logger.error(f"[outbox] Error processing {outbox_file}: {e}")
 
-                        severity = msg_data.get("severity", "info")
-                        from_agent = msg_data.get("from", machine_name)
-                        message = msg_data.get("message", "")
-
-                        emoji_map = {
-                            "critical": "🚨",
-                            "warning": "⚠️",
-                            "info": "ℹ️",
-                            "success": "✅",
-                            "alert": "🔔",
-                        }
-                        emoji = emoji_map.get(severity, "📬")
-
-                        order_payload = msg_data.get("order_payload", "")
-                        if order_payload:
-                            header = f"{emoji} *{from_agent}*\n\U0001f4e8 _{order_payload[:100]}_\n\n"
-                        else:
-                            header = f"{emoji} *{from_agent}*\n\n"
-
-                        full_text = header + message
-                        chunks = []
-                        while full_text:
-                            if len(full_text) <= 4000:
-                                chunks.append(full_text)
-                                break
-                            split_at = full_text.rfind("\n", 0, 4000)
-                            if split_at < 2000:
-                                split_at = 4000
-                            chunks.append(full_text[:split_at])
-                            full_text = full_text[split_at:].lstrip("\n")
-
-                        # Send to specific chat_id if present, otherwise all authorized
-                        target_chat = msg_data.get("chat_id")
-                        recipients = [target_chat] if target_chat else self.authorized
-
-                        for user_id in recipients:
-                            for chunk in chunks:
-                                try:
-                                    await self.app.bot.send_message(
-                                        chat_id=user_id,
-                                        text=chunk,
-                                        parse_mode="Markdown",
-                                    )
-                                except Exception:
-                                    try:
-                                        await self.app.bot.send_message(chat_id=user_id, text=chunk)
-                                    except Exception as e:
-                                        logger.error(f"[outbox] Failed to send to {user_id}: {e}")
-
-                        msg_data["sent"] = True
-                        msg_data["sent_at"] = datetime.now(timezone.utc).isoformat()
-                        with open(outbox_file, "w") as f:
-                            json.dump(msg_data, f, indent=2)
-
-                        logger.info(f"[outbox] Sent message from {machine_name}/{from_agent}")
+    async def _send_progress(self, chat_id, order_id: str, text: str) -> None:
+        """Send or update the single progress message for one order.
 
-                    except Exception as e:
-                        logger.error(f"[outbox] Error processing {outbox_file}: {e}")
+        Hermes emits a "processing" notification then a heartbeat per
+        minute for long orders; editMessageText keeps that to one in-place
+        status line for the same one API call per update.
+        """
+        key = (chat_id, order_id)
+        message_id = self._progress_msgs.get(key)
+        if message_id is not None:
+            try:
+                await self.app.bot.edit_message_text(
+                    chat_id=chat_id,
+                    message_id=message_id,
+                    text=text,
+                    parse_mode="HTML",
+                )
+                return
+            except Exception:
+                # Message deleted or too old to edit — fall back to sending
+                self._progress_msgs.pop(key, None)
+        try:
+            async with self._send_sem:
+                sent = await self.app.bot.send_message(
+                    chat_id=chat_id, text=text, parse_mode="HTML"
+                )
+            self._progress_msgs[key] = sent.message_id
+        except Exception as e:
+            logger.error(f"[outbox] Failed to send progress to {chat_id}: {e}")
+
+    async def _service_acknowledgments(self):
+        """One pass over due pending orders: notify on acknowledgment."""
+        # Pop only entries whose backoff delay has elapsed (lazy-deleting
+        # entries already removed from pending_orders)
+        now = time.time()
+        due = []
+        while self._ack_queue and self._ack_queue[0][0] <= now:
+            _, order_file = heapq.heappop(self._ack_queue)
+            if order_file in self.pending_orders:
+                due.append(order_file)
+
+        completed = []
+        for order_file in due:
+            order_path = Path(order_file)
+
+            if self._is_expired(self.pending_orders.created_at(order_file)):
+                logger.info(f"[poll] Evicting expired pending order {order_file}")
+                completed.append(order_file)
+                continue
 
-    async def poll_order_acknowledgments(self):
-        """Background task: Check for acknowledged orders and responses."""
-        while True:
-            await asyncio.sleep(self.poll_interval)
+            if not order_path.exists():
+                completed.append(order_file)
+                continue
 
-            completed = []
-            for order_file, tracking in list(self.pending_orders.items()):
-                order_path = Path(order_file)
+            try:
+                # mtime-keyed cache: a still-unacknowledged order is only
+                # reparsed when the executor actually rewrites it
+                order_data = await asyncio.to_thread(self._read_json_cached, order_path)
+
+                if order_data.get("acknowledged"):
+                    machine, chat_id, order_text = self.pending_orders.fields(
+                        order_file
+                    )
+
+                    machine_config = self.machines.get(machine)
+                    if machine_config and machine_config.is_local:
+                        repo = machine_config.repo_path
+                        order_ts = Path(order_file).stem
+
+                        # Use order_id from JSON for outbox lookup, fallback to filename
+                        order_id = order_data.get("order_id", order_ts)
+
+                        # Order is done — stop edit-merging its progress line
+                        self._progress_msgs.pop((chat_id, order_id), None)
+
+                        # Skip if outbox file exists (outbox has better routing with chat_id)
+                        outbox_file = repo / f".sisyphus/notepads/galaxy-outbox/hermes-{order_id}.json"
+                        if outbox_file.exists():
+                            completed.append(order_file)
+                            continue
 
-                if not order_path.exists():
-                    completed.append(order_file)
-                    continue
+                        # Only check response files if no outbox exists
+                        matching_response = repo / f".sisyphus/notepads/galaxy-order-response-{order_ts}.md"
 
-                try:
-                    with open(order_path) as f:
-                        order_data = json.load(f)
-
-                    if order_data.get("acknowledged"):
-                        machine = tracking["machine"]
-                        order_text = tracking["order_text"]
-                        chat_id = tracking["chat_id"]
-
-                        machine_config = self.machines.get(machine)
-                        if machine_config and self.is_local(machine_config):
-                            repo = machine_config["repo_path"]
-                            order_ts = Path(order_file).stem
-
-                            # Use order_id from JSON for outbox lookup, fallback to filename
-                            order_id = order_data.get("order_id", order_ts)
-
-                            # Skip if outbox file exists (outbox has better routing with chat_id)
-                            outbox_file = repo / f".sisyphus/notepads/galaxy-outbox/hermes-{order_id}.json"
-                            if outbox_file.exists():
-                                completed.append(order_file)
-                                continue
-
-                            # Only check response files if no outbox exists
-                            matching_response = repo / f".sisyphus/notepads/galaxy-order-response-{order_ts}.md"
-
-                            response_file = None
-                            if matching_response.exists():
-                                response_file = str(matching_response)
-                            else:
-                                response_pattern = str(repo / ".sisyphus/notepads/galaxy-order-response-*.md")
-                                responses = sorted(glob.glob(response_pattern))
-                                if responses:
-                                    response_file = responses[-1]
-
-                            if response_file:
-                                with open(response_file) as rf:
-                                    response_text = rf.read()
-
-                                lines = response_text.strip().split("\n")
-                                summary_lines = []
-                                for line in lines:
-                                    if line.startswith("#"):
-                                        continue
-                                    if line.strip():
-                                        summary_lines.append(line.strip())
-                                    if len("\n".join(summary_lines)) > 300:
-                                        break
-                                    if line.strip() == "" and summary_lines:
-                                        break
-
-                                if len(response_text) <= 1000:
-                                    header_msg = (
-                                        f"✅ <b>Order Acknowledged</b>\n\n"
-                                        f"📍 <code>{machine}</code>\n"
-                                        f"📨 <i>{order_text}</i>"
-                                    )
-                                    compact_response = self.format_response_compact(response_text)
-
-                                    await self.app.bot.send_message(
-                                        chat_id=chat_id,
-                                        text=header_msg,
-                                        parse_mode="HTML",
-                                    )
-                                    await self.app.bot.send_message(
-                                        chat_id=chat_id,
-                                        text=compact_response,
-                                        parse_mode="HTML",
-                                    )
-                                else:
-                                    compact_summary = self.format_response_compact(response_text)[:400]
-                                    msg = (
-                                        f"✅ <b>Order Acknowledged</b>\n\n"
-                                        f"📍 <code>{machine}</code>\n"
-                                        f"📨 <i>{order_text}</i>\n\n"
-                                        f"<b>Summary:</b>\n{compact_summary}...\n\n"
-                                        f"📎 Full response attached"
-                                    )
-                                    await self.app.bot.send_message(
-                                        chat_id=chat_id,
-                                        text=msg,
-                                        parse_mode="HTML",
-                                    )
-                                    with open(response_file, "rb") as f:
-                                        await self.app.bot.send_document(
-                                            chat_id=chat_id,
-                                            document=f,
-                                            filename=Path(response_file).name,
-                                            caption=f"📄 Full response from {machine}",
-                                        )
+                        response_file = None
+                        if matching_response.exists():
+                            response_file = str(matching_response)
+                        else:
+                            response_file = await asyncio.to_thread(
+                                self._latest_response_file,
+                                repo / ".sisyphus" / "notepads",
+                            )
+
+                        if response_file:
+                            # One read serves both the summary and the
+                            # attachment — decode a copy for formatting,
+                            # hand the raw bytes to send_document
+                            response_bytes = await asyncio.to_thread(
+                                Path(response_file).read_bytes
+                            )
+                            response_text = response_bytes.decode("utf-8", "replace")
+
+                            lines = response_text.strip().split("\n")
+                            summary_lines = []
+                            for line in lines:
+                                if line.startswith("#"):
+                                    continue
+                                if line.strip():
+                                    summary_lines.append(line.strip())
+                                if len("\n".join(summary_lines)) > 300:
+                                    break
+                                if line.strip() == "" and summary_lines:
+                                    break
+
+                            compact_response = self.format_response_compact(response_text)
+
+                            if len(response_text) <= 1000:
+                                header_msg = (
+                                    f"✅ <b>Order Acknowledged</b>\n\n"
+                                    f"📍 <code>{machine}</code>\n"
+                                    f"📨 <i>{order_text}</i>"
+                                )
+
+                                await self.app.bot.send_message(
+                                    chat_id=chat_id,
+                                    text=header_msg,
+                                    parse_mode="HTML",
+                                )
+                                await self.app.bot.send_message(
+                                    chat_id=chat_id,
+                                    text=compact_response,
+                                    parse_mode="HTML",
+                                )
                             else:
-                                no_response_msg = (
+                                compact_summary = compact_response[:400]
+                                msg = (
                                     f"✅ <b>Order Acknowledged</b>\n\n"
                                     f"📍 <code>{machine}</code>\n"
                                     f"📨 <i>{order_text}</i>\n\n"
-                                    f"⏳ <i>No response notepad yet</i>"
+                                    f"<b>Summary:</b>\n{compact_summary}...\n\n"
+                                    f"📎 Full response attached"
                                 )
                                 await self.app.bot.send_message(
                                     chat_id=chat_id,
-                                    text=no_response_msg,
+                                    text=msg,
                                     parse_mode="HTML",
                                 )
+                                await self.app.bot.send_document(
+                                    chat_id=chat_id,
+                                    document=io.BytesIO(response_bytes),
+                                    filename=Path(response_file).name,
+                                    caption=f"📄 Full response from {machine}",
+                                )
+                        else:
+                            no_response_msg = (
+                                f"✅ <b>Order Acknowledged</b>\n\n"
+                                f"📍 <code>{machine}</code>\n"
+                                f"📨 <i>{order_text}</i>\n\n"
+                                f"⏳ <i>No response notepad yet</i>"
+                            )
+                            await self.app.bot.send_message(
+                                chat_id=chat_id,
+                                text=no_response_msg,
+                                parse_mode="HTML",
+                            )
 
-                        completed.append(order_file)
-
-                except Exception as e:
-                    logger.error(f"[poll] Error checking {order_file}: {e}")
+                    completed.append(order_file)
 
-            for order_file in completed:
-                self.pending_orders.pop(order_file, None)
+            except Exception as e:
+                logger.error(f"[poll] Error checking {order_file}: {e}")
+
+        for order_file in completed:
+            self.pending_orders.pop(order_file)
+            self._json_cache.pop(order_file, None)
+        if completed:
+            await asyncio.to_thread(self._save_pending_orders)
+
+        # Re-queue still-pending entries with exponential backoff
+        for order_file in due:
+            delay = self.pending_orders.bump_delay(
+                order_file, self.poll_interval / 2, self.ACK_BACKOFF_MAX_SECONDS
+            )
+            if delay is None:
+                continue
+            heapq.heappush(self._ack_queue, (time.time() + delay, order_file))
 
     # --- DIGEST ---
 
     def _load_latest_digest(self) -> dict:
         """Load the latest digest from index for Telegram push."""
-        import json as _json
-
         index_path = Path(".sisyphus/digests/index.json")
         if not index_path.exists():
             return {"patterns": [], "references": [], "actions": []}
         try:
-            index = _json.loads(index_path.read_text(encoding="utf-8"))
-        except (_json.JSONDecodeError, OSError):
+            index = _json_loads(index_path.read_bytes())
+        except (ValueError, OSError):
             return {"patterns": [], "references": [], "actions": []}
         digests = index.get("digests", [])
         if not digests:
@@ -877,17 +1568,37 @@ class TelegramChannel(BaseChannel):
     async def _post_init(self, app):
         """Called after bot initialization - start background tasks."""
         logger.info("[background] Starting background tasks")
-        asyncio.create_task(self.poll_order_acknowledgments())
-        logger.info("[background] poll_order_acknowledgments task created")
-        asyncio.create_task(self.poll_outbox_messages())
-        logger.info("[background] poll_outbox_messages task created")
+        asyncio.create_task(self.poll_loop())
+        logger.info("[background] poll_loop task created")
 
     async def start(self) -> None:
         """Start Telegram bot with polling."""
         if "CHANGE-ME" in self.token:
             raise ValueError("Update telegram_token in config. See config.json.example")
 
-        self.app = ApplicationBuilder().token(self.token).post_init(self._post_init).build()
+        # A sized connection pool keeps sends on warm TLS connections —
+        # burst notifications reuse sockets instead of paying a handshake
+        # each, and HTTP/2 (when available) multiplexes them over one.
+        request = HTTPXRequest(
+            connection_pool_size=32,
+            pool_timeout=5.0,
+            http_version=_HTTP_VERSION,
+        )
+        builder = (
+            ApplicationBuilder()
+            .token(self.token)
+            .request(request)
+            .post_init(self._post_init)
+        )
+        if AIORateLimiter is not None:
+            try:
+                builder = builder.rate_limiter(
+                    AIORateLimiter(overall_max_rate=30, max_retries=3)
+                )
+            except RuntimeError:
+                # aiolimiter extra not installed — sends go out unpaced
+                logger.warning("AIORateLimiter unavailable, sending without rate limiting")
+        self.app = builder.build()
 
         self.app.add_handler(CommandHandler("start", self.cmd_help))
         self.app.add_handler(CommandHandler("help", self.cmd_help))
@@ -900,21 +1611,32 @@ class TelegramChannel(BaseChannel):
         self.app.add_handler(CommandHandler("machines", self.cmd_machines))
         self.app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self._on_text))
 
-        machine_list = ", ".join(self.machines.keys())
         logger.info(f"🌌 TelegramChannel online — default: {self.default_machine}")
-        logger.info(f"📞 Machines: {machine_list}")
+        logger.info(f"📞 Machines: {self._machines_str}")
 
         # run_polling blocks — use initialize + start + updater for non-blocking
         await self.app.initialize()
         await self.app.start()
-        await self.app.updater.start_polling()
+
+        webhook = self.config.get("webhook", {})
+        if webhook.get("url"):
+            # Webhook mode: Telegram pushes updates — no idle getUpdates
+            # round trips. Expects a TLS terminator (e.g. nginx) in front.
+            url_path = webhook.get("url_path", self.token)
+            await self.app.updater.start_webhook(
+                listen=webhook.get("listen", "0.0.0.0"),
+                port=webhook.get("port", 8443),
+                url_path=url_path,
+                webhook_url=f"{webhook['url'].rstrip('/')}/{url_path}",
+            )
+            logger.info("[updater] Webhook mode active")
+        else:
+            await self.app.updater.start_polling()
 
         # Start background tasks manually (post_init not reliable)
         logger.info("[background] Starting background tasks")
-        asyncio.create_task(self.poll_order_acknowledgments())
-        logger.info("[background] poll_order_acknowledgments task created")
-        asyncio.create_task(self.poll_outbox_messages())
-        logger.info("[background] poll_outbox_messages task created")
+        asyncio.create_task(self.poll_loop())
+        logger.info("[background] poll_loop task created")
 
         from handlers.digest_push import setup_digest_scheduler
 
@@ -924,30 +1646,68 @@ class TelegramChannel(BaseChannel):
 
     async def stop(self) -> None:
         """Stop Telegram bot gracefully."""
+        for writer in self._send_writers.values():
+            writer.cancel()
         if self.app:
             await self.app.updater.stop()
             await self.app.stop()
             await self.app.shutdown()
             logger.info("TelegramChannel stopped")
 
+    # Window over which outbound messages to the same chat are merged
+    SEND_COALESCE_SECONDS = 0.2
+
     async def send(self, msg: OutboundMessage) -> None:
-        """Send message to Telegram chat."""
+        """Queue message for the chat's coalescing writer.
+
+        A streamed reply (progress + result bursts from executors) lands
+        in the same coalescing window and goes out as one send_message
+        instead of one HTTPS round trip each, staying well clear of
+        Telegram's ~30 msg/s limit and its rate-limit backoff.
+        """
         if not self.app:
             logger.warning("TelegramChannel not started, cannot send")
             return
 
-        try:
-            # Try HTML parse mode first (supports compact format)
-            await self.app.bot.send_message(
-                chat_id=int(msg.chat_id),
-                text=msg.content,
-                parse_mode="HTML",
+        queue = self._send_queues.get(msg.chat_id)
+        if queue is None:
+            queue = self._send_queues[msg.chat_id] = asyncio.Queue()
+        queue.put_nowait(msg.content)
+        writer = self._send_writers.get(msg.chat_id)
+        if writer is None or writer.done():
+            self._send_writers[msg.chat_id] = asyncio.create_task(
+                self._coalesced_send(msg.chat_id, queue)
             )
-        except Exception:
+
+    async def _coalesced_send(self, chat_id, queue: asyncio.Queue) -> None:
+        """Drain one chat's queue each time the coalescing window elapses.
+
+        Exits once a window passes with nothing queued; send() spawns a
+        fresh writer on the next message. The drain check and the return
+        have no await between them, so a message enqueued while the writer
+        winds down is either drained here or sees a done() writer and gets
+        a new one — never stranded.
+        """
+        while True:
+            await asyncio.sleep(self.SEND_COALESCE_SECONDS)
+            parts = []
+            while True:
+                try:
+                    parts.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if not parts:
+                return
+            text = "\n\n".join(parts)
             try:
+                # Try HTML parse mode first (supports compact format)
                 await self.app.bot.send_message(
-                    chat_id=int(msg.chat_id),
-                    text=msg.content,
+                    chat_id=int(chat_id),
+                    text=text,
+                    parse_mode="HTML",
                 )
-            except Exception as e:
-                logger.error(f"Failed to send to {msg.chat_id}: {e}")
+            except Exception:
+                try:
+                    await self.app.bot.send_message(chat_id=int(chat_id), text=text)
+                except Exception as e:
+                    logger.error(f"Failed to send to {chat_id}: {e}")
@@ -1,13 +1,35 @@
 """WebChannel - WebSocket-based chat interface."""
 
 import asyncio
+import hashlib
 import importlib
 import json
 import logging
+from time import monotonic
 from typing import Any
 from aiohttp import web, WSMsgType
 from pathlib import Path
 
+# Optional: orjson encodes/decodes several times faster than stdlib json —
+# every WebSocket frame in both directions passes through here.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+
 from .base import BaseChannel
 from ..bus import OutboundMessage
 
@@ -17,6 +39,42 @@ log_event = session_tracker.log_event
 logger = logging.getLogger(__name__)
 
 
+# Static frames encoded once at import — the hot branches ship these
+# verbatim instead of re-building and re-serializing identical dicts.
+# Text frames (send_str) because the browser client JSON.parses strings.
+_REPLACED_FRAME = '{"type":"system","content":"Session replaced by new connection"}'
+
+
+def _pack_message(content: str, ts: float) -> str:
+    """Fixed-schema encoder for the outbound "message" payload.
+
+    The shape never varies, so the frame is two interpolations into a
+    literal template instead of a dict allocation plus a general JSON
+    encoder walk. _json_dumps on the content alone handles escaping.
+    """
+    return '{"type":"message","content":%s,"timestamp":%.6f}' % (
+        _json_dumps(content),
+        ts,
+    )
+
+
+class Connection:
+    """One authenticated WebSocket client: socket, outbound queue, writer.
+
+    Slotted so per-connection bookkeeping is a single small object behind
+    one dict lookup instead of parallel registries keyed per chat.
+    """
+
+    __slots__ = ("ws", "queue", "writer_task", "user_id", "username")
+
+    def __init__(self, ws, queue, writer_task, user_id, username):
+        self.ws = ws
+        self.queue = queue
+        self.writer_task = writer_task
+        self.user_id = user_id
+        self.username = username
+
+
 class WebChannel(BaseChannel):
     """Web-based chat channel using WebSockets.
 
@@ -31,10 +89,34 @@ class WebChannel(BaseChannel):
         self.user_store = user_store
         self.port = config.get("port", 8080)
         self.secure_cookies = config.get("secure_cookies", False)
-        self.connections: dict[str, web.WebSocketResponse] = {}
+        self.connections: dict[str, Connection] = {}
         self.app = None
         self.runner = None
         self.site = None
+        # Page bytes are read once at startup: index and login are tiny,
+        # never change while the process runs, and sit on every request's
+        # hot path — serving cached bytes with an ETag beats a FileResponse
+        # stat + open + sendfile round trip per hit.
+        self._static_dir = Path(__file__).parent.parent / "static"
+        self._index_page = self._load_page(self._static_dir / "index.html")
+        self._login_page = self._load_page(self._static_dir / "login.html")
+
+    @staticmethod
+    def _load_page(path: Path) -> tuple[bytes, str]:
+        """Read a static page once, returning its bytes and a strong ETag."""
+        body = path.read_bytes()
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+        return body, etag
+
+    @staticmethod
+    def _page_response(request, page: tuple[bytes, str]) -> web.Response:
+        """Serve cached page bytes, answering If-None-Match with a 304."""
+        body, etag = page
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=body, content_type="text/html", headers={"ETag": etag}
+        )
 
     async def start(self) -> None:
         """Start aiohttp web server."""
@@ -44,7 +126,7 @@ class WebChannel(BaseChannel):
         self.app.router.add_post("/login", self.handle_login)
         self.app.router.add_get("/logout", self.handle_logout)
         self.app.router.add_get("/ws", self.handle_websocket)
-        self.app.router.add_static("/static", Path(__file__).parent.parent / "static")
+        self.app.router.add_static("/static", self._static_dir)
 
         self.runner = web.AppRunner(self.app)
         await self.runner.setup()
@@ -61,18 +143,81 @@ class WebChannel(BaseChannel):
         logger.info("WebChannel stopped")
 
     async def send(self, msg: OutboundMessage) -> None:
-        """Send message to WebSocket client."""
-        ws = self.connections.get(msg.chat_id)
-        if ws and not ws.closed:
-            await ws.send_json(
-                {
-                    "type": "message",
-                    "content": msg.content,
-                    "timestamp": asyncio.get_event_loop().time(),
-                }
-            )
-        else:
+        """Queue a message for the client's writer task.
+
+        Producers never touch the socket directly — they enqueue and return,
+        and the per-connection writer coalesces whatever has accumulated
+        into as few frames as possible.
+        """
+        conn = self.connections.get(msg.chat_id)
+        if conn is None:
             logger.warning(f"No active WebSocket for chat_id={msg.chat_id}")
+            return
+        self._enqueue(
+            conn.queue,
+            _pack_message(msg.content, monotonic()),
+            msg.chat_id,
+        )
+
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue, item, chat_id) -> None:
+        """Enqueue with drop-oldest overflow handling.
+
+        A consumer stalled behind a bad network loses its stalest queued
+        message rather than blocking producers or growing memory without
+        bound; on recovery the client sees the most recent state first.
+        """
+        try:
+            queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning(f"Outbound queue full for chat_id={chat_id}, dropping")
+
+    def broadcast(self, chat_ids, content: str) -> None:
+        """Send identical content to many chats, serializing once.
+
+        The payload is encoded a single time and the same string object is
+        pushed to every connection's queue; the writer ships pre-encoded
+        frames as-is, so N recipients cost one serialization and share one
+        payload in memory instead of N copies.
+        """
+        payload = _pack_message(content, monotonic())
+        for chat_id in chat_ids:
+            conn = self.connections.get(chat_id)
+            if conn is not None:
+                self._enqueue(conn.queue, payload, chat_id)
+
+    async def _writer(self, ws: web.WebSocketResponse, queue: asyncio.Queue) -> None:
+        """Drain one connection's outbound queue into WebSocket frames.
+
+        Blocks for the first message, then collects everything already
+        queued without awaiting, so a burst of N messages costs one frame
+        and one writer drain instead of N. Every queued item is already an
+        encoded frame string: singles ship verbatim, and bursts are joined
+        into a batch frame the frontend unwraps — no re-serialization on
+        either path.
+        """
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if len(batch) == 1:
+                await ws.send_str(batch[0])
+            else:
+                await ws.send_str(
+                    '{"type":"batch","items":[%s]}' % ",".join(batch)
+                )
 
     async def handle_index(self, request):
         """Serve index.html (requires authentication)."""
@@ -80,14 +225,12 @@ class WebChannel(BaseChannel):
         if token:
             user_data = self.user_store.verify_token(token)
             if user_data:
-                index_path = Path(__file__).parent.parent / "static" / "index.html"
-                return web.FileResponse(index_path)
+                return self._page_response(request, self._index_page)
         raise web.HTTPFound("/login")
 
     async def handle_login_page(self, request):
         """Serve login.html."""
-        login_path = Path(__file__).parent.parent / "static" / "login.html"
-        return web.FileResponse(login_path)
+        return self._page_response(request, self._login_page)
 
     async def handle_login(self, request):
         """Authenticate user and set JWT cookie."""
@@ -136,9 +279,9 @@ class WebChannel(BaseChannel):
 
     async def handle_websocket(self, request):
         """WebSocket handler (requires authentication)."""
-        ws = web.WebSocketResponse(autoping=True, heartbeat=5.0)
-        await ws.prepare(request)
-
+        # Authenticate before the upgrade: a rejected client costs one
+        # plain 401 instead of a WebSocketResponse allocation, handshake,
+        # error frame, and close sequence.
         token = request.cookies.get("galaxy_token")
         logger.debug(f"WebSocket auth: token={'present' if token else 'missing'}")
 
@@ -159,19 +302,26 @@ class WebChannel(BaseChannel):
                 component="web",
                 remote=request.remote,
             )
-            await ws.send_json(
-                {"type": "error", "content": "Unauthorized - please login"}
-            )
-            await ws.close()
-            return ws
+            return web.Response(status=401, text="Unauthorized - please login")
+
+        # writer_limit lifts the default 16 KiB high-water mark so bursty
+        # backends (batched frames, notification storms) buffer in the TCP
+        # send buffer instead of awaiting a drain per small write.
+        # compress=False refuses permessage-deflate negotiation: frames here
+        # are small JSON, so zlib state per connection costs more than the
+        # bytes it saves.
+        ws = web.WebSocketResponse(
+            autoping=True, heartbeat=5.0, writer_limit=2**20, compress=False
+        )
+        await ws.prepare(request)
 
         user_id = user_data["user_id"]
         chat_id = user_id
         sender_id = user_id
         logger.debug(f"WebSocket user_id: {user_id}")
 
-        old_ws = self.connections.get(chat_id)
-        if old_ws and not old_ws.closed:
+        old_conn = self.connections.get(chat_id)
+        if old_conn and not old_conn.ws.closed:
             log_event(
                 "frontend_ws_replaced",
                 component="web",
@@ -181,12 +331,13 @@ class WebChannel(BaseChannel):
                 remote=request.remote,
             )
             logger.debug(f"Closing old WebSocket for {chat_id}")
-            await old_ws.send_json(
-                {"type": "system", "content": "Session replaced by new connection"}
-            )
-            await old_ws.close()
+            await old_conn.ws.send_str(_REPLACED_FRAME)
+            await old_conn.ws.close()
 
-        self.connections[chat_id] = ws
+        queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        writer_task = asyncio.create_task(self._writer(ws, queue))
+        conn = Connection(ws, queue, writer_task, user_id, user_data["username"])
+        self.connections[chat_id] = conn
         log_event(
             "frontend_ws_connected",
             component="web",
@@ -198,19 +349,24 @@ class WebChannel(BaseChannel):
         logger.debug(f"Added WebSocket to connections: {chat_id}")
 
         logger.debug(f"Sending welcome message to {chat_id}")
-        await ws.send_json(
-            {
-                "type": "system",
-                "content": f"Connected as {user_data['username']}",
-                "chat_id": chat_id,
-            }
+        # Templated like _pack_message: the only dynamic parts are escaped
+        # individually, skipping the dict + full encoder pass
+        await ws.send_str(
+            '{"type":"system","content":%s,"chat_id":%s}'
+            % (
+                _json_dumps(f"Connected as {user_data['username']}"),
+                _json_dumps(chat_id),
+            )
         )
         logger.debug(f"Welcome message sent, entering message loop")
 
         try:
             async for msg in ws:
-                if msg.type == WSMsgType.TEXT:
-                    data = json.loads(msg.data)
+                # Binary frames skip aiohttp's per-frame UTF-8 validation
+                # and the bytes→str copy; the JSON decoder accepts bytes
+                # directly. Text frames stay supported for older clients.
+                if msg.type == WSMsgType.TEXT or msg.type == WSMsgType.BINARY:
+                    data = _json_loads(msg.data)
                     content = data.get("content", "")
 
                     await self._handle_message(
@@ -238,7 +394,11 @@ class WebChannel(BaseChannel):
             )
         finally:
             logger.debug(f"WebSocket loop exited for {chat_id}, closed={ws.closed}")
-            self.connections.pop(chat_id, None)
+            writer_task.cancel()
+            # Identity-guarded: a replacement connection under the same
+            # chat_id must not have its entry evicted by the old handler
+            if self.connections.get(chat_id) is conn:
+                self.connections.pop(chat_id, None)
             log_event(
                 "frontend_ws_disconnected",
                 component="web",
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,6 +10,26 @@ from typing import Dict, Any
 
 from caduceus.executors.base import Executor
 
+# Optional: inotify-backed directory watching. When unavailable the
+# response wait falls back to exists() polling every poll_interval.
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+# Optional: orjson serializes straight to bytes, several times faster than
+# stdlib json — every order, notification, and heartbeat goes through here.
+try:
+    import orjson
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 class HermesExecutor(Executor):
     """Executor that delegates to existing hermes.py daemon.
@@ -21,6 +42,9 @@ class HermesExecutor(Executor):
     This preserves the existing hermes.py daemon without modifications.
     """
 
+    # Liveness notification cadence for orders running longer than a minute
+    HEARTBEAT_INTERVAL = 60
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize HermesExecutor.
 
@@ -40,6 +64,96 @@ class HermesExecutor(Executor):
         # Ensure orders directory exists
         self.orders_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Blocking tmp-write plus atomic rename — call via asyncio.to_thread."""
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _cleanup_order_artifacts(stale_file: Path, processing_notif: Path,
+                                 outbox_dir: Path, order_id: str) -> None:
+        """Blocking removal of a finished order's leftovers — call via
+        asyncio.to_thread.
+
+        stale_file is the response file on success or the unclaimed order
+        file on timeout.
+        """
+        try:
+            stale_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+        try:
+            processing_notif.unlink(missing_ok=True)
+        except OSError:
+            pass
+        for hb in outbox_dir.glob(f"heartbeat-{order_id}-*.json"):
+            try:
+                hb.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    async def _wait_for_response(self, response_file: Path) -> bool:
+        """Wait until response_file exists or the timeout elapses.
+
+        With watchfiles available the coroutine sleeps until the notepads
+        directory actually changes — millisecond reaction and zero idle
+        syscalls instead of an exists() check per poll_interval, which
+        averages half an interval of added latency per order. Falls back
+        to the polling loop when watchfiles is absent.
+        """
+        deadline = time.time() + self.timeout
+        while time.time() < deadline:
+            if response_file.exists():
+                return True
+            if awatch is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            stop_event = asyncio.Event()
+            timer = asyncio.get_running_loop().call_later(
+                max(deadline - time.time(), 0), stop_event.set
+            )
+            try:
+                async for _changes in awatch(
+                    str(self.notepads_dir), stop_event=stop_event
+                ):
+                    if response_file.exists():
+                        break
+            except Exception:
+                await asyncio.sleep(self.poll_interval)
+            finally:
+                timer.cancel()
+        return response_file.exists()
+
+    async def _heartbeat_loop(self, outbox_dir: Path, order_id: str,
+                              payload: str, chat_id) -> None:
+        """Emit a liveness notification every heartbeat interval.
+
+        Runs as its own task alongside the response wait and is cancelled
+        when the order completes; only orders running longer than the
+        interval ever produce one.
+        """
+        start_time = time.time()
+        while True:
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+            elapsed = time.time() - start_time
+            elapsed_min = int(elapsed // 60)
+            hb_file = outbox_dir / f"heartbeat-{order_id}-{int(elapsed)}.json"
+            try:
+                await asyncio.to_thread(hb_file.write_bytes, _json_dumps_bytes({
+                    "type": "notification",
+                    "severity": "info",
+                    "from": "Hermes",
+                    "order_id": order_id,
+                    "message": f"⏳ <b>Still working...</b> ({elapsed_min}m elapsed)\n\n<code>{payload[:60]}</code>",
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "sent": False,
+                    "chat_id": chat_id,
+                }))
+            except OSError:
+                pass  # Heartbeat write failure is non-fatal
+
     async def execute(self, order: Dict[str, Any]) -> Dict[str, Any]:
         """Execute order via hermes.py filesystem bridge.
 
@@ -66,10 +180,15 @@ class HermesExecutor(Executor):
         processing_notif = outbox_dir / f"processing-{order_id}.json"
 
         try:
-            # Write order file
+            # Write order file via tmp + atomic rename, so the daemon's
+            # directory watcher can never read a half-written JSON file.
+            # All disk I/O goes through to_thread — a blocking write here
+            # would stall every other gateway coroutine.
             order_file = self.orders_dir / f"{order_id}.json"
-            order_file.write_text(
-                json.dumps(
+            await asyncio.to_thread(
+                self._write_atomic,
+                order_file,
+                _json_dumps_bytes(
                     {
                         "payload": payload,
                         "timestamp": order.get("timestamp", time.time()),
@@ -79,14 +198,13 @@ class HermesExecutor(Executor):
                             for k, v in order.items()
                             if k not in ["payload", "timestamp", "order_id"]
                         },
-                    },
-                    indent=2,
-                )
+                    }
+                ),
             )
 
             # Signal 2: Processing acknowledgment — notify user order was picked up
-            outbox_dir.mkdir(parents=True, exist_ok=True)
-            processing_notif.write_text(json.dumps({
+            await asyncio.to_thread(outbox_dir.mkdir, parents=True, exist_ok=True)
+            await asyncio.to_thread(processing_notif.write_bytes, _json_dumps_bytes({
                 "type": "notification",
                 "severity": "info",
                 "from": "Hermes",
@@ -95,81 +213,41 @@ class HermesExecutor(Executor):
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "sent": False,
                 "chat_id": order.get("chat_id"),
-            }, indent=2))
+            }))
 
-            # Wait for response file
+            # Wait for response file, with heartbeats decoupled into their
+            # own task so liveness cadence doesn't depend on wait wakeups
             response_file = self.notepads_dir / f"galaxy-order-response-{order_id}.md"
-            start_time = time.time()
-            last_heartbeat = start_time
-            HEARTBEAT_INTERVAL = 60  # seconds — only for orders running >1 minute
-
-            while time.time() - start_time < self.timeout:
-                if response_file.exists():
-                    # Read response
-                    response_text = response_file.read_text()
-
-                    # Clean up response file
-                    try:
-                        response_file.unlink()
-                    except OSError:
-                        pass
-
-                    # Cleanup liveness notifications
-                    try:
-                        processing_notif.unlink(missing_ok=True)
-                    except OSError:
-                        pass
-                    for hb in outbox_dir.glob(f"heartbeat-{order_id}-*.json"):
-                        try:
-                            hb.unlink(missing_ok=True)
-                        except OSError:
-                            pass
-
-                    return {
-                        "success": True,
-                        "response_text": response_text,
-                    }
+            heartbeat_task = asyncio.create_task(
+                self._heartbeat_loop(outbox_dir, order_id, payload, order.get("chat_id"))
+            )
+            try:
+                found = await self._wait_for_response(response_file)
+            finally:
+                heartbeat_task.cancel()
+                # Await the cancellation so a heartbeat write mid-flight
+                # finishes (or unwinds) before cleanup deletes its files
+                await asyncio.gather(heartbeat_task, return_exceptions=True)
 
-                # Signal 3: Heartbeat every 60s after first minute
-                elapsed = time.time() - start_time
-                if elapsed >= HEARTBEAT_INTERVAL and (time.time() - last_heartbeat) >= HEARTBEAT_INTERVAL:
-                    elapsed_min = int(elapsed // 60)
-                    payload_preview = payload[:60]
-                    hb_file = outbox_dir / f"heartbeat-{order_id}-{int(elapsed)}.json"
-                    try:
-                        hb_file.write_text(json.dumps({
-                            "type": "notification",
-                            "severity": "info",
-                            "from": "Hermes",
-                            "order_id": order_id,
-                            "message": f"⏳ <b>Still working...</b> ({elapsed_min}m elapsed)\n\n<code>{payload_preview}</code>",
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "sent": False,
-                            "chat_id": order.get("chat_id"),
-                        }, indent=2))
-                    except OSError:
-                        pass  # Heartbeat write failure is non-fatal
-                    last_heartbeat = time.time()
+            if found:
+                response_text = await asyncio.to_thread(response_file.read_text)
 
-                await asyncio.sleep(self.poll_interval)
+                # Clean up response file and liveness notifications
+                await asyncio.to_thread(
+                    self._cleanup_order_artifacts,
+                    response_file, processing_notif, outbox_dir, order_id,
+                )
 
-            # Timeout - clean up order file if still exists
-            if order_file.exists():
-                try:
-                    order_file.unlink()
-                except OSError:
-                    pass
+                return {
+                    "success": True,
+                    "response_text": response_text,
+                }
 
-            # Cleanup liveness notifications on timeout
-            try:
-                processing_notif.unlink(missing_ok=True)
-            except OSError:
-                pass
-            for hb in outbox_dir.glob(f"heartbeat-{order_id}-*.json"):
-                try:
-                    hb.unlink(missing_ok=True)
-                except OSError:
-                    pass
+            # Timeout - clean up unclaimed order file and liveness notifications
+            await asyncio.to_thread(
+                self._cleanup_order_artifacts,
+                order_file, processing_notif, outbox_dir, order_id,
+            )
 
             return {
                 "success": False,
@@ -180,7 +258,7 @@ class HermesExecutor(Executor):
         except Exception as e:
             # Cleanup liveness notifications on error
             try:
-                processing_notif.unlink(missing_ok=True)
+                await asyncio.to_thread(processing_notif.unlink, missing_ok=True)
             except OSError:
                 pass
             return {
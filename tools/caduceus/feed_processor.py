@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
 import importlib
 import json
 import logging
+import os
 import re
 import unicodedata
 from datetime import datetime, timezone
@@ -11,8 +14,75 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+import aiohttp
+import requests
 import trafilatura
 from newspaper import Article
+from requests.adapters import HTTPAdapter
+
+# Optional: orjson parses several times faster than stdlib json and
+# serializes straight to bytes — every ingest touches the index and the
+# enrichment monitor parses agent stdout through these.
+try:
+    import orjson
+
+    def _jloads(data):
+        return orjson.loads(data)
+
+    def _jdumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _jloads(data):
+        return json.loads(data)
+
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Pooled HTTP session for tweet lookups: both endpoints (publish.twitter.com
+# oEmbed, api.fxtwitter.com) are hit once per ingested tweet, so keep-alive
+# connections amortize the TCP + TLS handshake across a batch instead of
+# paying it per request.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+_HTTP.headers.update(
+    {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"}
+)
+atexit.register(_HTTP.close)
+
+# Shared async session for page fetches inside process_feed. Built lazily
+# because a ClientSession must be created on a running loop; reused across
+# all feed items so concurrent ingests share one connection pool.
+_AIOHTTP: aiohttp.ClientSession | None = None
+
+
+def _aiohttp_session() -> aiohttp.ClientSession:
+    global _AIOHTTP
+    if _AIOHTTP is None or _AIOHTTP.closed:
+        _AIOHTTP = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+    return _AIOHTTP
+
+
+async def _fetch_html(url: str) -> str | None:
+    """Fetch page HTML through the shared session. Returns None on failure.
+
+    One GET serves both extractors downstream — previously the same URL
+    was fetched twice (trafilatura then newspaper), each through blocking
+    libraries that stalled the event loop for the full round trip.
+    """
+    try:
+        async with _aiohttp_session().get(
+            url, timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            if resp.status != 200:
+                return None
+            return await resp.text(errors="ignore")
+    except Exception:
+        return None
 
 opencode_runtime = importlib.import_module("opencode_runtime")
 resolve_opencode_binary = opencode_runtime.resolve_opencode_binary
@@ -78,9 +148,9 @@ def _load_enrichment_session_id(repo_root: Path) -> str | None:
     try:
         session_file = _session_file_path(repo_root)
         if session_file.exists():
-            data = json.loads(session_file.read_text())
+            data = _jloads(session_file.read_bytes())
             return data.get("session_id")
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):
         pass
     return None
 
@@ -92,13 +162,12 @@ def _save_enrichment_session_id(repo_root: Path, session_id: str) -> None:
     try:
         session_file = _session_file_path(repo_root)
         session_file.parent.mkdir(parents=True, exist_ok=True)
-        session_file.write_text(
-            json.dumps(
+        session_file.write_bytes(
+            _jdumps(
                 {
                     "session_id": session_id,
                     "updated_at": datetime.now(timezone.utc).isoformat(),
-                },
-                indent=2,
+                }
             )
         )
     except OSError:
@@ -117,17 +186,37 @@ DEEPWIKI_ERROR_PATTERNS = [
 
 NOT_ENRICHED_MARKER = "DeepWiki analysis unavailable for this repository."
 
+# Hot-path patterns compiled once at import: every ingest runs these
+# several times each, and precompiling skips the re-module cache lookup
+# per call. The error patterns collapse into one alternation so the
+# enriched document is scanned in a single pass instead of once per
+# pattern.
+_WS_RE = re.compile(r"\s+")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_DASHES_RE = re.compile(r"-+")
+_TWEET_ID_RE = re.compile(r"/status/(\d+)")
+_TWEET_USER_RE = re.compile(r"twitter\.com/(\w+)/status/")
+_RELEVANCE_RE = re.compile(r"(## Relevance to Our Work\n\n).*?(\n\n## )", re.DOTALL)
+_PATTERNS_RE = re.compile(r"(## Applicable Patterns\n\n).*", re.DOTALL)
+_DEEPWIKI_ERR_RE = re.compile("|".join(map(re.escape, DEEPWIKI_ERROR_PATTERNS)))
+
 
 def _to_ascii(value: str) -> str:
+    # Most feed strings are already ASCII; isascii() is a C-level flag
+    # check, so the common case skips NFKD normalization and both
+    # encode/decode allocations
+    if value.isascii():
+        return value
     return unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
 
 
 def _clean_whitespace(value: str) -> str:
-    return re.sub(r"\s+", " ", value).strip()
+    return _WS_RE.sub(" ", value).strip()
 
 
 def _split_sentences(text: str) -> list[str]:
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = _SENT_RE.split(text)
     return [s.strip() for s in sentences if len(s.strip()) > 20]
 
 
@@ -140,8 +229,8 @@ def _slugify(value: str, max_length: int = 200) -> str:
                     after adding date prefix and .md extension)
     """
     ascii_value = _to_ascii(value).lower()
-    ascii_value = re.sub(r"[^a-z0-9]+", "-", ascii_value)
-    ascii_value = re.sub(r"-+", "-", ascii_value).strip("-")
+    ascii_value = _NONALNUM_RE.sub("-", ascii_value)
+    ascii_value = _DASHES_RE.sub("-", ascii_value).strip("-")
 
     # Truncate to max_length, avoiding mid-word cuts
     if len(ascii_value) > max_length:
@@ -186,19 +275,16 @@ def _is_twitter_url(url: str) -> bool:
 
 
 def _extract_tweet_id(url: str) -> str | None:
-    m = re.search(r"/status/(\d+)", url)
+    m = _TWEET_ID_RE.search(url)
     return m.group(1) if m else None
 
 
 def _resolve_tweet_username(tweet_id: str) -> str | None:
     """Use Twitter oEmbed to resolve @username when URL is /i/status/<id>."""
-    import urllib.request as _req
-
     oembed = f"https://publish.twitter.com/oembed?url=https://twitter.com/i/status/{tweet_id}&omit_script=true"
     try:
-        r = _req.urlopen(_req.Request(oembed, headers={"User-Agent": "Mozilla/5.0"}), timeout=8)
-        html = json.loads(r.read()).get("html", "")
-        m = re.search(r"twitter\.com/(\w+)/status/", html)
+        html = _HTTP.get(oembed, timeout=8).json().get("html", "")
+        m = _TWEET_USER_RE.search(html)
         return m.group(1) if m else None
     except Exception:
         return None
@@ -206,12 +292,9 @@ def _resolve_tweet_username(tweet_id: str) -> str | None:
 
 def _fxtwitter_api(username: str, tweet_id: str) -> dict[str, Any] | None:
     """Fetch tweet data from api.fxtwitter.com JSON API. Returns tweet dict or None."""
-    import urllib.request as _req
-
     api_url = f"https://api.fxtwitter.com/{username}/status/{tweet_id}"
     try:
-        r = _req.urlopen(_req.Request(api_url, headers={"User-Agent": "Mozilla/5.0"}), timeout=10)
-        return json.loads(r.read()).get("tweet")
+        return _HTTP.get(api_url, timeout=10).json().get("tweet")
     except Exception:
         return None
 
@@ -306,6 +389,9 @@ def _extract_domain_tag(url: str) -> str | None:
     return primary or None
 
 
+# Cached: the same URLs recur across duplicate-detection scans and
+# enrichment retries, and urlparse dominates the cost
+@functools.lru_cache(maxsize=4096)
 def _canonical_url(url: str) -> str:
     parsed = urlparse(url.strip())
     netloc = parsed.netloc.lower()
@@ -316,16 +402,29 @@ def _canonical_url(url: str) -> str:
     return f"{parsed.scheme.lower()}://{netloc}{path}{query}"
 
 
-def _find_existing_reference(references: list[dict[str, Any]], url: str) -> tuple[int, dict[str, Any]] | None:
-    target = _canonical_url(url)
-    for idx in range(len(references) - 1, -1, -1):
-        ref = references[idx]
-        existing_url = ref.get("url")
-        if not isinstance(existing_url, str):
-            continue
-        if _canonical_url(existing_url) == target:
-            return idx, ref
-    return None
+def _canonical_map(index_data: dict[str, Any]) -> dict[str, int]:
+    """Canonical-URL → reference-index map, built once per index load.
+
+    Kept under a derived key on the loaded dict (stripped before writes)
+    so duplicate detection is a hash lookup instead of re-canonicalizing
+    every stored URL per ingest. Later entries win, matching the old
+    reverse linear scan.
+    """
+    by_canonical = index_data.get("_by_canonical")
+    if by_canonical is None:
+        by_canonical = index_data["_by_canonical"] = {
+            _canonical_url(url): idx
+            for idx, ref in enumerate(index_data.get("references", []))
+            if isinstance(url := ref.get("url"), str)
+        }
+    return by_canonical
+
+
+def _find_existing_reference(index_data: dict[str, Any], url: str) -> tuple[int, dict[str, Any]] | None:
+    idx = _canonical_map(index_data).get(_canonical_url(url))
+    if idx is None:
+        return None
+    return idx, index_data["references"][idx]
 
 
 def _select_summary(extracted_text: str, article_summary: str | None) -> str:
@@ -344,34 +443,76 @@ def _select_key_insights(extracted_text: str, fallback_summary: str) -> list[str
     return ["Extracted content is available for review."]
 
 
-def _base_sections(summary_ascii: str, key_insights: list[str]) -> list[str]:
-    lines = [
-        "",
-        "## Summary",
-        "",
-        summary_ascii or "Summary unavailable; extraction succeeded but content was sparse.",
-        "",
-        "## Key Insights",
-        "",
-    ]
-
-    for insight in key_insights:
-        insight_ascii = _to_ascii(insight)
-        if insight_ascii:
-            lines.append(f"- {insight_ascii}")
-
-    lines += [
-        "",
-        "## Relevance to Our Work",
-        "",
-        RELEVANCE_PLACEHOLDER,
-        "",
-        "## Applicable Patterns",
-        "",
-        PATTERNS_PLACEHOLDER,
-        "",
-    ]
-    return lines
+# Whole-document template: every field is known before the write, so the
+# file body is one format call instead of ~25 list appends plus a join walk
+_REFERENCE_TMPL = """# {title}
+
+**Source**: {url}
+**Type**: {ref_type}
+**Ingested**: {ingested}
+**Tags**: {tags}
+**Note**: {note}
+**Via**: {via}
+
+---
+
+## Summary
+
+{summary}
+
+## Key Insights
+
+{insights}
+
+## Relevance to Our Work
+
+{relevance}
+
+## Applicable Patterns
+
+{patterns}
+"""
+
+
+def _extract_content(url: str, html: str) -> tuple[str, str, list[str], list[str]]:
+    """Blocking trafilatura + newspaper extraction — call via asyncio.to_thread.
+
+    Both extractors parse the already-fetched HTML; newspaper gets it via
+    set_html instead of its own download, so the page is fetched once.
+
+    Returns (title, summary, key_insights, keywords).
+    """
+    metadata = trafilatura.extract_metadata(html)
+    extracted_text = (
+        trafilatura.extract(
+            html,
+            include_comments=False,
+            include_tables=False,
+            include_links=False,
+        )
+        or ""
+    )
+    title = metadata.title if metadata and metadata.title else url
+
+    article_summary: str | None = None
+    keywords: list[str] = []
+    try:
+        np_article = Article(url)
+        np_article.set_html(html)
+        np_article.parse()
+        try:
+            np_article.nlp()
+        except Exception:
+            pass
+        article_summary = np_article.summary if np_article.summary else None
+        if isinstance(np_article.keywords, list):
+            keywords = [kw for kw in np_article.keywords if kw]
+    except Exception:
+        pass
+
+    summary = _select_summary(extracted_text, article_summary)
+    key_insights = _select_key_insights(extracted_text, summary)
+    return title, summary, key_insights, keywords
 
 
 def _outbox_dir_from_references(references_dir: Path) -> Path:
@@ -393,10 +534,7 @@ def _write_failure_notification(references_dir: Path, message: str, chat_id: int
     }
     if chat_id is not None:
         payload["chat_id"] = chat_id
-    (outbox_dir / f"deepwiki-enrich-{ts_slug}.json").write_text(
-        json.dumps(payload, indent=2),
-        encoding="utf-8",
-    )
+    (outbox_dir / f"deepwiki-enrich-{ts_slug}.json").write_bytes(_jdumps(payload))
 
 
 def _build_enrichment_prompt(repo_url: str, owner: str, repo: str, reference_path: Path) -> str:
@@ -425,7 +563,7 @@ def _contains_deepwiki_errors(content: str) -> bool:
     These appear when the enrichment agent writes error messages from DeepWiki
     directly into the reference file instead of meaningful analysis.
     """
-    return any(pattern in content for pattern in DEEPWIKI_ERROR_PATTERNS)
+    return _DEEPWIKI_ERR_RE.search(content) is not None
 
 
 def _clean_failed_enrichment(reference_path: Path) -> None:
@@ -437,19 +575,9 @@ def _clean_failed_enrichment(reference_path: Path) -> None:
     content = reference_path.read_text(encoding="utf-8")
 
     # Replace Relevance section content (between ## Relevance and next ##)
-    content = re.sub(
-        r"""(## Relevance to Our Work\n\n).*?(\n\n## )""",
-        rf"\1{NOT_ENRICHED_MARKER}\2",
-        content,
-        flags=re.DOTALL,
-    )
+    content = _RELEVANCE_RE.sub(rf"\1{NOT_ENRICHED_MARKER}\2", content)
     # Replace Applicable Patterns section content (between ## Applicable and EOF or next ##)
-    content = re.sub(
-        r"""(## Applicable Patterns\n\n).*""",
-        rf"\1- {NOT_ENRICHED_MARKER}\n",
-        content,
-        flags=re.DOTALL,
-    )
+    content = _PATTERNS_RE.sub(rf"\1- {NOT_ENRICHED_MARKER}\n", content)
 
     reference_path.write_text(content, encoding="utf-8")
 
@@ -467,8 +595,8 @@ def _update_index_analysis(references_dir: Path, reference_path: Path, status: s
         return
 
     try:
-        index_data = json.loads(index_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        index_data = _ensure_index(index_path)
+    except (ValueError, OSError):
         return
 
     file_name = reference_path.name
@@ -479,7 +607,7 @@ def _update_index_analysis(references_dir: Path, reference_path: Path, status: s
     else:
         return  # Reference not found in index
 
-    index_path.write_text(json.dumps(index_data, indent=2), encoding="utf-8")
+    _write_index(index_path, index_data)
 
 
 async def _monitor_enrichment_job(
@@ -548,20 +676,21 @@ async def _monitor_enrichment_job(
         _update_index_analysis(references_dir, reference_path, "deepwiki-not-indexed")
         return
 
-    # Extract and save session ID for reuse
+    # Extract and save session ID for reuse. Byte-level substring check
+    # first: agent stdout can run to megabytes of JSON events, and only
+    # the line carrying sessionID is worth decoding, let alone parsing.
     repo_root = references_dir.parent.parent
-    for line in (stdout_bytes.decode("utf-8", errors="ignore") or "").strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            sid = data.get("sessionID")
+    if b'"sessionID"' in stdout_bytes:
+        for line in stdout_bytes.splitlines():
+            if b'"sessionID"' not in line:
+                continue
+            try:
+                sid = _jloads(line).get("sessionID")
+            except ValueError:
+                continue
             if sid:
                 _save_enrichment_session_id(repo_root, sid)
                 break
-        except json.JSONDecodeError:
-            continue
 
     # Enrichment succeeded with real content
     _update_index_analysis(references_dir, reference_path, "deepwiki-enriched")
@@ -640,7 +769,7 @@ def _validate_index(index_path: Path) -> bool:
     JSON degrades catastrophically - one missing comma breaks the entire file.
     """
     try:
-        data = json.loads(index_path.read_text(encoding="utf-8"))
+        data = _jloads(index_path.read_bytes())
         assert isinstance(data.get("references"), list), "references must be a list"
         for ref in data["references"]:
             required = [
@@ -656,17 +785,40 @@ def _validate_index(index_path: Path) -> bool:
             missing = [k for k in required if k not in ref]
             assert not missing, f"missing required fields: {missing}"
         return True
-    except (json.JSONDecodeError, AssertionError, KeyError) as e:
+    except (ValueError, AssertionError, KeyError) as e:
         logger.error(f"index.json validation failed: {e}")
         return False
 
 
+def _dump_index(index_data: dict[str, Any]) -> bytes:
+    """Serialize index data, excluding derived in-memory keys."""
+    return _jdumps({k: v for k, v in index_data.items() if k != "_by_canonical"})
+
+
+# Parsed index per path, keyed on mtime: bursty ingests and enrichment
+# status flips reuse the in-memory dict instead of re-reading and
+# re-parsing the whole file per event. External writes bump the mtime
+# and invalidate naturally.
+_INDEX_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+
+def _write_index(index_path: Path, index_data: dict[str, Any]) -> None:
+    """Write index data via tmp + atomic rename and refresh the cache."""
+    tmp = index_path.with_suffix(".json.tmp")
+    tmp.write_bytes(_dump_index(index_data))
+    os.replace(tmp, index_path)
+    _INDEX_CACHE[index_path] = (index_path.stat().st_mtime_ns, index_data)
+
+
 def _ensure_index(index_path: Path) -> dict[str, Any]:
     if not index_path.exists():
         data = {"version": "1.0", "references": []}
-        index_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _write_index(index_path, data)
         return data
-    data = json.loads(index_path.read_text(encoding="utf-8"))
+    cached = _INDEX_CACHE.get(index_path)
+    if cached is not None and cached[0] == index_path.stat().st_mtime_ns:
+        return cached[1]
+    data = _jloads(index_path.read_bytes())
     # Repair legacy entries missing required fields (backward compat)
     repaired = False
     for ref in data.get("references", []):
@@ -674,7 +826,9 @@ def _ensure_index(index_path: Path) -> dict[str, Any]:
             ref["shared_via"] = "tui"
             repaired = True
     if repaired:
-        index_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _write_index(index_path, data)
+    else:
+        _INDEX_CACHE[index_path] = (index_path.stat().st_mtime_ns, data)
     return data
 
 
@@ -683,8 +837,8 @@ def _load_runtime_config(references_dir: Path) -> dict[str, Any] | None:
     if not config_path.exists():
         return None
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
+        data = _jloads(config_path.read_bytes())
+    except (ValueError, OSError) as exc:
         logger.warning(f"Failed to load Galaxy config from {config_path}: {exc}")
         return None
     if isinstance(data, dict):
@@ -726,71 +880,23 @@ async def process_feed(
                 logger.info(f"[feed] fxtwitter API: {url!r} → {title!r}")
             else:
                 fetch_url = _rewrite_twitter_url(url)
-                downloaded = trafilatura.fetch_url(fetch_url)
-                if not downloaded:
+                html = await _fetch_html(fetch_url)
+                if not html:
                     return {"error": "Failed to fetch Twitter URL (API and scraping both failed)"}
-                metadata = trafilatura.extract_metadata(downloaded)
-                extracted_text = (
-                    trafilatura.extract(
-                        downloaded,
-                        include_comments=False,
-                        include_tables=False,
-                        include_links=False,
-                    )
-                    or ""
+                title, summary, key_insights, keywords = await asyncio.to_thread(
+                    _extract_content, url, html
                 )
-                title = metadata.title if metadata and metadata.title else url
                 if "JavaScript is not available" in title:
                     return {
                         "error": "Twitter content is JS-gated; fxtwitter API also failed. Post may be deleted or private."
                     }
-                article_summary: str | None = None
-                try:
-                    np_article = Article(url)
-                    np_article.download()
-                    np_article.parse()
-                    try:
-                        np_article.nlp()
-                    except Exception:
-                        pass
-                    article_summary = np_article.summary if np_article.summary else None
-                    if isinstance(np_article.keywords, list):
-                        keywords = [kw for kw in np_article.keywords if kw]
-                except Exception:
-                    pass
-                summary = _select_summary(extracted_text, article_summary)
-                key_insights = _select_key_insights(extracted_text, summary)
         else:
-            downloaded = trafilatura.fetch_url(url)
-            if not downloaded:
+            html = await _fetch_html(url)
+            if not html:
                 return {"error": "Failed to fetch URL"}
-            metadata = trafilatura.extract_metadata(downloaded)
-            extracted_text = (
-                trafilatura.extract(
-                    downloaded,
-                    include_comments=False,
-                    include_tables=False,
-                    include_links=False,
-                )
-                or ""
+            title, summary, key_insights, keywords = await asyncio.to_thread(
+                _extract_content, url, html
             )
-            title = metadata.title if metadata and metadata.title else url
-            article_summary = None
-            try:
-                np_article = Article(url)
-                np_article.download()
-                np_article.parse()
-                try:
-                    np_article.nlp()
-                except Exception:
-                    pass
-                article_summary = np_article.summary if np_article.summary else None
-                if isinstance(np_article.keywords, list):
-                    keywords = [kw for kw in np_article.keywords if kw]
-            except Exception:
-                pass
-            summary = _select_summary(extracted_text, article_summary)
-            key_insights = _select_key_insights(extracted_text, summary)
 
         ref_type = _detect_type(url)
         tags: set[str] = set()
@@ -818,7 +924,7 @@ async def process_feed(
 
         index_data = _ensure_index(index_path)
         references = index_data.setdefault("references", [])
-        existing_match = _find_existing_reference(references, url)
+        existing_match = _find_existing_reference(index_data, url)
 
         timestamp = datetime.now(timezone.utc)
         date_prefix = timestamp.strftime("%Y-%m-%d")
@@ -841,24 +947,29 @@ async def process_feed(
         # Initialize metadata for reference entry
         reference_metadata: dict[str, Any] = {}
 
-        # Build markdown header
-        markdown_lines = [
-            f"# {title_ascii or 'Untitled'}",
-            "",
-            f"**Source**: {url}",
-            f"**Type**: {ref_type}",
-            f"**Ingested**: {timestamp.isoformat().replace('+00:00', 'Z')}",
-            f"**Tags**: {', '.join(tag_list)}",
-        ]
-
-        markdown_lines.append(f"**Note**: {note_ascii or 'None'}")
-        markdown_lines.append(f"**Via**: {via}")
-        markdown_lines.append("")
-        markdown_lines.append("---")
-        markdown_lines += _base_sections(summary_ascii, key_insights)
-
+        insights_block = "\n".join(
+            f"- {insight_ascii}"
+            for insight in key_insights
+            if (insight_ascii := _to_ascii(insight))
+        )
         file_path = references_dir / file_name
-        file_path.write_text("\n".join(markdown_lines), encoding="utf-8")
+        file_path.write_text(
+            _REFERENCE_TMPL.format(
+                title=title_ascii or "Untitled",
+                url=url,
+                ref_type=ref_type,
+                ingested=timestamp.isoformat().replace("+00:00", "Z"),
+                tags=", ".join(tag_list),
+                note=note_ascii or "None",
+                via=via,
+                summary=summary_ascii
+                or "Summary unavailable; extraction succeeded but content was sparse.",
+                insights=insights_block,
+                relevance=RELEVANCE_PLACEHOLDER,
+                patterns=PATTERNS_PLACEHOLDER,
+            ),
+            encoding="utf-8",
+        )
 
         deepwiki_enabled = bool(
             "github.com" in url.lower()
@@ -909,9 +1020,10 @@ async def process_feed(
         else:
             reference_entry["created_at"] = shared_at
             references.append(reference_entry)
+            _canonical_map(index_data)[_canonical_url(url)] = len(references) - 1
 
         # Write and validate immediately
-        index_path.write_text(json.dumps(index_data, indent=2), encoding="utf-8")
+        _write_index(index_path, index_data)
 
         if not _validate_index(index_path):
             # Index corrupted - restore previous state if possible
@@ -920,7 +1032,8 @@ async def process_feed(
                 references[existing_idx] = existing_ref
             else:
                 references.pop()
-            index_path.write_text(json.dumps(index_data, indent=2), encoding="utf-8")
+                _canonical_map(index_data).pop(_canonical_url(url), None)
+            _write_index(index_path, index_data)
             return {
                 "slug": slug,
                 "title": title_ascii or "Untitled",
@@ -92,9 +92,7 @@ async def outbound_dispatcher(bus: MessageBus, channels: dict[str, Any]):
         bus: MessageBus instance
         channels: Dict of {name: channel} for message delivery
     """
-    while True:
-        msg = await bus.consume_outbound()
-
+    async def dispatch(msg):
         channel = channels.get(msg.channel)
         if channel:
             try:
@@ -105,6 +103,12 @@ async def outbound_dispatcher(bus: MessageBus, channels: dict[str, Any]):
         else:
             logger.warning(f"No channel '{msg.channel}' for outbound message")
 
+    while True:
+        # Drain the backlog in one wake and fan out the sends concurrently —
+        # a burst of N responses costs one round-trip's latency, not N.
+        msgs = await bus.consume_outbound_batch()
+        await asyncio.gather(*(dispatch(msg) for msg in msgs))
+
 
 def load_config(config_path: str) -> dict[str, Any]:
     """Load configuration from JSON file."""
@@ -136,6 +140,7 @@ def build_channels(config: dict[str, Any], bus: MessageBus) -> dict[str, Any]:
         db_path=auth_config.get("db_path", ".galaxy/users.db"),
         jwt_secret=jwt_secret,
         token_expiry_hours=auth_config.get("token_expiry_hours", 24),
+        bcrypt_rounds=auth_config.get("bcrypt_rounds", 12),
     )
     logger.info(
         f"UserStore initialized: {auth_config.get('db_path', '.galaxy/users.db')}"
@@ -289,6 +294,17 @@ def main():
 
     config = load_config(args.config)
 
+    # Optional: uvloop replaces the default selector loop — the gateway is
+    # I/O-bound (Telegram polling plus many small order/outbox file ops) and
+    # inherits the faster loop with no other changes.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("uvloop event loop policy enabled")
+    except ImportError:
+        pass
+
     try:
         asyncio.run(run_gateway(config, test_mode=args.test_mode))
     except KeyboardInterrupt:
@@ -18,12 +18,16 @@ function connect() {
     
     ws.onmessage = (event) => {
         const data = JSON.parse(event.data);
-        
-        if (data.type === 'system' && data.chat_id) {
-            chatId = data.chat_id;
+        // Bursts arrive coalesced into a single batch frame
+        const items = data.type === 'batch' ? data.items : [data];
+
+        for (const item of items) {
+            if (item.type === 'system' && item.chat_id) {
+                chatId = item.chat_id;
+            }
+
+            addMessage(item);
         }
-        
-        addMessage(data);
     };
     
     ws.onerror = (error) => {
@@ -61,10 +65,12 @@ function sendMessage() {
     const content = inputEl.value.trim();
     if (!content || !ws || ws.readyState !== WebSocket.OPEN) return;
     
-    ws.send(JSON.stringify({
+    // Binary frame: the server skips per-frame UTF-8 validation and
+    // decodes the bytes directly
+    ws.send(new TextEncoder().encode(JSON.stringify({
         content: content,
         sender_id: chatId
-    }));
+    })));
     
     addMessage({
         type: 'user',
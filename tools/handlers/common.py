@@ -5,6 +5,7 @@ from pathlib import Path
 
 
 PROJECT_TAG_PATTERN = re.compile(r"#([\w-]+)")
+SCHEDULE_PATTERN = re.compile(r"⏰(\d+)([hmd])")
 
 
 def now_iso():
@@ -76,7 +77,7 @@ def parse_priority_and_schedule(text):
             text = text.replace(mark, "").strip()
 
     schedule_at = None
-    schedule_match = re.search(r"⏰(\d+)([hmd])", text)
+    schedule_match = SCHEDULE_PATTERN.search(text)
     if schedule_match:
         amount = int(schedule_match.group(1))
         unit = schedule_match.group(2)
@@ -87,7 +88,7 @@ def parse_priority_and_schedule(text):
         else:
             delta_seconds = amount * 86400
         schedule_at = datetime.now(timezone.utc).timestamp() + delta_seconds
-        text = re.sub(r"⏰\d+[hmd]", "", text).strip()
+        text = SCHEDULE_PATTERN.sub("", text).strip()
 
     scheduled_for = (
         datetime.fromtimestamp(schedule_at, timezone.utc).isoformat()